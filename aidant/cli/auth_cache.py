@@ -0,0 +1,70 @@
+"""Remember recently validated API keys so startup can skip the network check.
+
+Validating a key costs a full HTTPS round-trip to the provider on every
+launch. Keys that validated successfully within the last day are recorded
+here by provider, as a SHA-256 hash of the key and base URL; the key itself
+is never written to disk.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# How long a successful validation is trusted, in seconds
+_TTL_SECONDS = 24 * 60 * 60
+
+_CACHE_PATH = Path.home() / ".aidant" / "auth_cache.json"
+
+
+def is_recently_validated(provider: str, api_key: str, base_url: Optional[str] = None) -> bool:
+    """Return True if this key validated for the provider within the TTL."""
+    entry = _load_cache().get(provider)
+    if not isinstance(entry, dict):
+        return False
+
+    validated_at = entry.get("validated_at")
+    if not isinstance(validated_at, (int, float)) or time.time() - validated_at >= _TTL_SECONDS:
+        return False
+
+    return entry.get("key_hash") == _hash_key(api_key, base_url)
+
+
+def remember_validated(provider: str, api_key: str, base_url: Optional[str] = None) -> None:
+    """Record a successful validation; failures to write the cache are ignored."""
+    cache = _load_cache()
+    cache[provider] = {
+        "key_hash": _hash_key(api_key, base_url),
+        "validated_at": time.time()
+    }
+
+    try:
+        _CACHE_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_PATH.parent, prefix=".auth_cache.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, _CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _hash_key(api_key: str, base_url: Optional[str]) -> str:
+    """Hash the key together with the endpoint it was validated against."""
+    return hashlib.sha256(f"{base_url or ''}\0{api_key}".encode("utf-8")).hexdigest()
+
+
+def _load_cache() -> dict:
+    """Read the cache file, treating a missing or corrupt file as empty."""
+    try:
+        with open(_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
@@ -20,19 +20,9 @@ class CommandHandler:
         self.chat_service = chat_service
         self.ui = ui
         self.repository = repository
-    
-    def handle_command(self, command: str) -> None:
-        """Handle a command input."""
-        parts = command[1:].split()  # Remove leading '/' and split
-        
-        if not parts:
-            return
-        
-        cmd = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
         
         # Map commands to methods
-        command_map = {
+        self._commands = {
             'help': self._help,
             'add': self._add_files,
             'files': self._show_files,
@@ -43,9 +33,20 @@ class CommandHandler:
             'session': self._show_session,
             'models': self._show_models,
         }
+    
+    def handle_command(self, command: str) -> None:
+        """Handle a command input."""
+        parts = command[1:].split()  # Remove leading '/' and split
+        
+        if not parts:
+            return
         
-        if cmd in command_map:
-            command_map[cmd](args)
+        cmd = parts[0].lower()
+        args = parts[1:] if len(parts) > 1 else []
+        
+        handler = self._commands.get(cmd)
+        if handler is not None:
+            handler(args)
         else:
             self.ui.show_error(f"Unknown command: /{cmd}. Type '/help' for available commands.")
     
@@ -74,15 +75,23 @@ class CommandHandler:
                 self.ui.show_success(f"Added {len(valid_files)} files to context")
                 
                 # Show file contents
+                contents = []
                 for file_path in valid_files:
                     try:
                         content = self.repository.get_file_content(file_path)
-                        # Truncate very long files for display
+                        # Truncate very long files for display, at the end of a line
+                        # when one comes soon after the limit
                         if len(content) > 1000:
-                            content = content[:1000] + "\n... (truncated)"
-                        self.ui.show_file_content(file_path, content)
+                            cut = content.find("\n", 1000, 1200)
+                            if cut == -1:
+                                cut = 1000
+                            content = content[:cut] + "\n... (truncated)"
+                        contents.append((file_path, content))
                     except Exception as e:
                         self.ui.show_warning(f"Could not display {file_path}: {str(e)}")
+                
+                if contents:
+                    self.ui.show_file_contents(contents)
                         
             except Exception as e:
                 self.ui.show_error(f"Error adding files: {str(e)}")
@@ -110,7 +119,7 @@ class CommandHandler:
         
         if self.ui.confirm("Clear all files from context?"):
             self.chat_service.current_session.active_files.clear()
-            self.chat_service.current_session.context.clear()
+            self.chat_service.current_session.clear_context()
             self.ui.show_success("Context cleared")
     
     def _show_status(self, args: List[str]) -> None:
@@ -122,7 +131,7 @@ class CommandHandler:
                 self.ui.show_info("Repository is clean")
                 return
             
-            self.ui.show_info("Repository status:")
+            lines = ["Repository status:"]
             
             # Group by status
             status_groups = {}
@@ -133,9 +142,11 @@ class CommandHandler:
                 status_groups[status].append(file_info.path)
             
             for status, files in status_groups.items():
-                self.ui.show_info(f"\n{status.title()}:")
+                lines.append(f"\n{status.title()}:")
                 for file_path in files:
-                    self.ui.show_info(f"  {file_path}")
+                    lines.append(f"  {file_path}")
+            
+            self.ui.show_lines(lines)
                     
         except Exception as e:
             self.ui.show_error(f"Error getting status: {str(e)}")
@@ -170,15 +181,17 @@ class CommandHandler:
                 self.ui.show_info("No commit history available")
                 return
             
-            self.ui.show_info(f"Recent commits (last {len(commits)}):")
+            lines = [f"Recent commits (last {len(commits)}):"]
             for commit in commits:
-                self.ui.show_info(f"  {commit.hash} - {commit.message}")
-                self.ui.show_info(f"    by {commit.author} at {commit.timestamp}")
+                lines.append(f"  {commit.hash} - {commit.message}")
+                lines.append(f"    by {commit.author} at {commit.timestamp}")
                 if commit.files_changed:
-                    self.ui.show_info(f"    files: {', '.join(commit.files_changed[:3])}")
+                    lines.append(f"    files: {', '.join(commit.files_changed[:3])}")
                     if len(commit.files_changed) > 3:
-                        self.ui.show_info(f"    ... and {len(commit.files_changed) - 3} more")
-                self.ui.show_info("")
+                        lines.append(f"    ... and {len(commit.files_changed) - 3} more")
+                lines.append("")
+            
+            self.ui.show_lines(lines)
                 
         except Exception as e:
             self.ui.show_error(f"Error getting history: {str(e)}")
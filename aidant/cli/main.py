@@ -2,24 +2,22 @@
 
 import typer
 import os
+import stat
 import sys
 import logging
+import logging.handlers
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Dict, Callable
 from enum import Enum
 
-from ..core.container import container
-from ..core.interfaces.coder import ICoder
-from ..core.interfaces.llm_provider import ILLMProvider
-from ..core.interfaces.repository import IRepository
-from ..core.interfaces.ui import IUserInterface
-from ..core.services.chat_service import ChatService
-from ..infrastructure.llm.openai_provider import OpenAIProvider
-from ..infrastructure.llm.anthropic_provider import AnthropicProvider
-from ..infrastructure.repository.git_repository import GitRepository
-from ..infrastructure.coders.editblock.editblock_coder import EditBlockCoder
-from ..ui.terminal.terminal_interface import TerminalInterface
-from .commands import CommandHandler
+from .auth_cache import is_recently_validated, remember_validated
+from ..utils.early_input import start_capturing_early_input
+
+# The core and infrastructure packages are imported only once a session starts,
+# so --help and argument errors don't pay for them
+if TYPE_CHECKING:
+    from ..core.interfaces.coder import ICoder
+    from ..core.interfaces.llm_provider import ILLMProvider
 
 
 class ProviderChoice(str, Enum):
@@ -33,6 +31,12 @@ class CoderChoice(str, Enum):
     editblock = "editblock"
 
 
+# Strings reused on every chat loop iteration
+_THINKING = "Thinking..."
+_ERROR_FMT = "Error: {}".format
+_COMMAND_ERROR_FMT = "Command error: {}".format
+
+
 # Create the main Typer app
 app = typer.Typer(
     name="aidant",
@@ -44,25 +48,72 @@ app = typer.Typer(
 def setup_logging(verbose: bool) -> None:
     """Setup logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
+    
+    # delay=True defers opening the log file until the first record is emitted
+    handlers: List[logging.Handler] = [
+        logging.handlers.RotatingFileHandler(
+            'aidant.log', maxBytes=1 << 20, backupCount=3, delay=True
+        )
+    ]
+    if verbose:
+        handlers.append(logging.StreamHandler())
+    
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('aidant.log'),
-            logging.StreamHandler() if verbose else logging.NullHandler()
-        ]
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=handlers
     )
 
 
+def _create_openai_provider(api_key: str, base_url: Optional[str]) -> "ILLMProvider":
+    """Create the OpenAI provider."""
+    from ..infrastructure.llm.openai_provider import OpenAIProvider
+    return OpenAIProvider(api_key, base_url=base_url)
+
+
+def _create_anthropic_provider(api_key: str, base_url: Optional[str]) -> "ILLMProvider":
+    """Create the Anthropic provider."""
+    if base_url:
+        raise ValueError("Custom base URL is not supported for Anthropic provider")
+    from ..infrastructure.llm.anthropic_provider import AnthropicProvider
+    return AnthropicProvider(api_key)
+
+
+def _create_editblock_coder(workspace: str) -> "ICoder":
+    """Create the EditBlock coder."""
+    from ..infrastructure.coders.editblock.editblock_coder import EditBlockCoder
+    return EditBlockCoder(workspace)
+
+
+# Infrastructure is imported inside the factories so only the selected SDKs get loaded
+_PROVIDER_FACTORIES: Dict[ProviderChoice, Callable[[str, Optional[str]], "ILLMProvider"]] = {
+    ProviderChoice.openai: _create_openai_provider,
+    ProviderChoice.anthropic: _create_anthropic_provider,
+}
+
+_CODER_FACTORIES: Dict[CoderChoice, Callable[[str], "ICoder"]] = {
+    CoderChoice.editblock: _create_editblock_coder,
+}
+
+
 def setup_container(
     workspace: str,
-    provider: str,
+    provider: ProviderChoice,
     api_key: str,
     model: str,
-    coder_type: str,
+    coder_type: CoderChoice,
     base_url: Optional[str] = None
 ) -> None:
     """Setup dependency injection container."""
+    from ..core.container import container
+    from ..core.interfaces.coder import ICoder
+    from ..core.interfaces.llm_provider import ILLMProvider
+    from ..core.interfaces.repository import IRepository
+    from ..core.interfaces.ui import IUserInterface
+    from ..core.services.chat_service import ChatService
+    from ..infrastructure.repository.git_repository import GitRepository
+    from ..ui.terminal.terminal_interface import TerminalInterface
     
     # Register UI
     container.register_instance(IUserInterface, TerminalInterface())
@@ -71,24 +122,18 @@ def setup_container(
     container.register_instance(IRepository, GitRepository(workspace))
     
     # Register LLM Provider
-    if provider == "openai":
-        llm_provider = OpenAIProvider(api_key, base_url=base_url)
-    elif provider == "anthropic":
-        if base_url:
-            raise ValueError("Custom base URL is not supported for Anthropic provider")
-        llm_provider = AnthropicProvider(api_key)
-    else:
+    provider_factory = _PROVIDER_FACTORIES.get(provider)
+    if provider_factory is None:
         raise ValueError(f"Unsupported provider: {provider}")
     
-    container.register_instance(ILLMProvider, llm_provider)
+    container.register_instance(ILLMProvider, provider_factory(api_key, base_url))
     
     # Register Coder
-    if coder_type == "editblock":
-        coder = EditBlockCoder(workspace)
-    else:
+    coder_factory = _CODER_FACTORIES.get(coder_type)
+    if coder_factory is None:
         raise ValueError(f"Unsupported coder type: {coder_type}")
     
-    container.register_instance(ICoder, coder)
+    container.register_instance(ICoder, coder_factory(workspace))
     
     # Register Chat Service
     container.register(ChatService, ChatService, singleton=True)
@@ -103,27 +148,33 @@ def main(
     workspace: str = typer.Option(".", help="Workspace directory"),
     coder: CoderChoice = typer.Option(CoderChoice.editblock, help="Coder type to use"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose logging"),
-    files: Optional[List[str]] = typer.Option(None, "--files", help="Files to add to initial context")
+    files: Optional[List[str]] = typer.Option(None, "--files", help="Files to add to initial context"),
+    max_history: Optional[int] = typer.Option(None, "--max-history", min=2, help="Keep at most this many messages per session, system prompt included (default: keep all)")
 ) -> None:
     """Start Aidant - AI Pair Programming Assistant with improved architecture."""
     
+    # Buffer keystrokes typed while we import SDKs and validate the API key
+    start_capturing_early_input()
+    
     # Setup logging
     setup_logging(verbose)
     
     # Get API key from environment if not provided
     if not api_key:
-        if provider == ProviderChoice.openai:
-            api_key = os.getenv('OPENAI_API_KEY')
-        elif provider == ProviderChoice.anthropic:
-            api_key = os.getenv('ANTHROPIC_API_KEY')
+        api_key_var = f"{provider.value.upper()}_API_KEY"
+        api_key = os.environ.get(api_key_var)
         
         if not api_key:
-            typer.echo(f"Error: API key required. Set {provider.value.upper()}_API_KEY environment variable or use --api-key option.", err=True)
+            typer.echo(f"Error: API key required. Set {api_key_var} environment variable or use --api-key option.", err=True)
             raise typer.Exit(1)
     
-    # Validate workspace
-    workspace_path = Path(workspace).resolve()
-    if not workspace_path.exists():
+    # Validate workspace with a single lstat; only symlinks need resolving.
+    # '..' is left for the OS to follow, since it may step out of a symlink.
+    workspace_path = Path.cwd() / workspace
+    try:
+        if stat.S_ISLNK(os.lstat(workspace_path).st_mode):
+            workspace_path = workspace_path.resolve(strict=True)
+    except OSError:
         typer.echo(f"Error: Workspace directory '{workspace}' does not exist.", err=True)
         raise typer.Exit(1)
     
@@ -132,24 +183,36 @@ def main(
         typer.echo(f"Error: --base-url option is only supported with --provider=openai", err=True)
         raise typer.Exit(1)
     
+    from ..core.container import container
+    from ..core.interfaces.llm_provider import ILLMProvider
+    from ..core.interfaces.repository import IRepository
+    from ..core.interfaces.ui import IUserInterface
+    from ..core.services.chat_service import ChatService
+    
     try:
         # Setup container
-        setup_container(str(workspace_path), provider.value, api_key, model, coder.value, base_url)
+        setup_container(str(workspace_path), provider, api_key, model, coder, base_url)
         
-        # Get services
-        ui = container.get(IUserInterface)
-        chat_service = container.get(ChatService)
+        # Resolve services once; the chat loop only uses these locals
+        ui, chat_service, llm_provider, repository = (
+            container.get(IUserInterface),
+            container.get(ChatService),
+            container.get(ILLMProvider),
+            container.get(IRepository),
+        )
         
-        # Validate API key
-        llm_provider = container.get(ILLMProvider)
-        if not llm_provider.validate_api_key():
-            ui.show_error("Invalid API key. Please check your credentials.")
-            raise typer.Exit(1)
+        # Validate API key, unless it already validated recently
+        if not is_recently_validated(provider.value, api_key, base_url):
+            if not llm_provider.validate_api_key():
+                ui.show_error("Invalid API key. Please check your credentials.")
+                raise typer.Exit(1)
+            remember_validated(provider.value, api_key, base_url)
         
         # Show welcome message
         ui.show_welcome()
         
         # Start session with initial files
+        chat_service.max_history = max_history
         initial_files = list(files) if files else []
         session = chat_service.start_session(initial_files)
         
@@ -157,7 +220,8 @@ def main(
             ui.show_info(f"Added {len(initial_files)} files to context: {', '.join(initial_files)}")
         
         # Create command handler
-        command_handler = CommandHandler(chat_service, ui, container.get(IRepository))
+        from .commands import CommandHandler
+        command_handler = CommandHandler(chat_service, ui, repository)
         
         # Main chat loop
         provider_info = f"{provider.value} {model}"
@@ -180,18 +244,18 @@ def main(
                     try:
                         command_handler.handle_command(user_input)
                     except Exception as e:
-                        ui.show_error(f"Command error: {str(e)}")
+                        ui.show_error(_COMMAND_ERROR_FMT(e))
                     continue
                 
                 # Process regular chat message
-                ui.start_spinner("Thinking...")
+                ui.start_spinner(_THINKING)
                 try:
-                    response = chat_service.process_user_message(user_input, model)
+                    # The spinner is stopped by the chat service once the first chunk arrives
+                    chat_service.process_user_message_stream(user_input, model)
                     ui.stop_spinner()
-                    ui.show_message(response)
                 except Exception as e:
                     ui.stop_spinner()
-                    ui.show_error(f"Error: {str(e)}")
+                    ui.show_error(_ERROR_FMT(e))
                 
             except KeyboardInterrupt:
                 ui.stop_spinner()
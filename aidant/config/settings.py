@@ -1,12 +1,16 @@
 """Configuration settings for Aidant."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Callable, Tuple
 import os
+import re
 from pathlib import Path
 
+from ..utils.file_utils import compile_glob_patterns
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMSettings:
     """LLM provider settings."""
     provider: str = "openai"
@@ -18,7 +22,7 @@ class LLMSettings:
     timeout: int = 600
 
 
-@dataclass
+@dataclass(slots=True)
 class CoderSettings:
     """Coder settings."""
     type: str = "editblock"
@@ -27,7 +31,7 @@ class CoderSettings:
     backup_files: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositorySettings:
     """Repository settings."""
     auto_commit: bool = True
@@ -37,9 +41,14 @@ class RepositorySettings:
         '.venv/*', 'venv/*', 'dist/*', 'build/*', '.DS_Store',
         '*.log', '*.tmp', '.pytest_cache/*'
     ])
+    
+    @property
+    def ignore_matcher(self) -> Callable[[str], Optional[re.Match]]:
+        """Matcher for ``ignore_patterns``, compiled once per distinct pattern set."""
+        return compile_glob_patterns(tuple(self.ignore_patterns))
 
 
-@dataclass
+@dataclass(slots=True)
 class UISettings:
     """UI settings."""
     theme: str = "monokai"
@@ -49,7 +58,7 @@ class UISettings:
     verbose: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Main application settings."""
     workspace: str = "."
@@ -64,73 +73,59 @@ class AppSettings:
         settings = cls()
         
         # LLM settings
-        if os.getenv('AIDER_PROVIDER'):
-            settings.llm.provider = os.getenv('AIDER_PROVIDER')
-        if os.getenv('AIDER_MODEL'):
-            settings.llm.model = os.getenv('AIDER_MODEL')
-        if os.getenv('OPENAI_API_KEY'):
-            settings.llm.api_key = os.getenv('OPENAI_API_KEY')
-        elif os.getenv('ANTHROPIC_API_KEY'):
-            settings.llm.api_key = os.getenv('ANTHROPIC_API_KEY')
+        provider = os.getenv('AIDER_PROVIDER')
+        if provider:
+            settings.llm.provider = provider
+        model = os.getenv('AIDER_MODEL')
+        if model:
+            settings.llm.model = model
+        api_key = os.getenv('OPENAI_API_KEY') or os.getenv('ANTHROPIC_API_KEY')
+        if api_key:
+            settings.llm.api_key = api_key
         
         # Coder settings
-        if os.getenv('AIDER_CODER'):
-            settings.coder.type = os.getenv('AIDER_CODER')
-        if os.getenv('AIDER_AUTO_APPLY'):
-            settings.coder.auto_apply = os.getenv('AIDER_AUTO_APPLY').lower() == 'true'
+        coder_type = os.getenv('AIDER_CODER')
+        if coder_type:
+            settings.coder.type = coder_type
+        auto_apply = os.getenv('AIDER_AUTO_APPLY')
+        if auto_apply:
+            settings.coder.auto_apply = auto_apply.lower() == 'true'
         
         # Repository settings
-        if os.getenv('AIDER_AUTO_COMMIT'):
-            settings.repository.auto_commit = os.getenv('AIDER_AUTO_COMMIT').lower() == 'true'
+        auto_commit = os.getenv('AIDER_AUTO_COMMIT')
+        if auto_commit:
+            settings.repository.auto_commit = auto_commit.lower() == 'true'
         
         # UI settings
-        if os.getenv('AIDER_THEME'):
-            settings.ui.theme = os.getenv('AIDER_THEME')
-        if os.getenv('AIDER_VERBOSE'):
-            settings.ui.verbose = os.getenv('AIDER_VERBOSE').lower() == 'true'
+        theme = os.getenv('AIDER_THEME')
+        if theme:
+            settings.ui.theme = theme
+        verbose = os.getenv('AIDER_VERBOSE')
+        if verbose:
+            settings.ui.verbose = verbose.lower() == 'true'
         
         return settings
     
     @classmethod
     def load_from_file(cls, config_path: Path) -> 'AppSettings':
         """Load settings from a configuration file."""
-        import toml
-        
-        if not config_path.exists():
+        try:
+            config_stat = config_path.stat()
+        except FileNotFoundError:
             return cls()
         
         try:
-            config_data = toml.load(config_path)
+            cache_key = (str(config_path), config_stat.st_mtime_ns)
+            config_data = _TOML_CACHE.get(cache_key)
+            if config_data is None:
+                config_data = _TOML_CACHE[cache_key] = _parse_toml(config_path)
             
             settings = cls()
             
-            # Update LLM settings
-            if 'llm' in config_data:
-                llm_data = config_data['llm']
-                for key, value in llm_data.items():
-                    if hasattr(settings.llm, key):
-                        setattr(settings.llm, key, value)
-            
-            # Update coder settings
-            if 'coder' in config_data:
-                coder_data = config_data['coder']
-                for key, value in coder_data.items():
-                    if hasattr(settings.coder, key):
-                        setattr(settings.coder, key, value)
-            
-            # Update repository settings
-            if 'repository' in config_data:
-                repo_data = config_data['repository']
-                for key, value in repo_data.items():
-                    if hasattr(settings.repository, key):
-                        setattr(settings.repository, key, value)
-            
-            # Update UI settings
-            if 'ui' in config_data:
-                ui_data = config_data['ui']
-                for key, value in ui_data.items():
-                    if hasattr(settings.ui, key):
-                        setattr(settings.ui, key, value)
+            _apply_section(config_data.get('llm', {}), settings.llm, _LLM_FIELDS)
+            _apply_section(config_data.get('coder', {}), settings.coder, _CODER_FIELDS)
+            _apply_section(config_data.get('repository', {}), settings.repository, _REPOSITORY_FIELDS)
+            _apply_section(config_data.get('ui', {}), settings.ui, _UI_FIELDS)
             
             return settings
             
@@ -175,6 +170,63 @@ class AppSettings:
             toml.dump(config_data, f)
 
 
+# Parsed config files keyed by (path, mtime_ns)
+_TOML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _parse_toml(config_path: Path) -> Dict[str, Any]:
+    """Parse a TOML file, preferring the stdlib parser when available."""
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import toml
+        return toml.load(config_path)
+    
+    with open(config_path, 'rb') as f:
+        return tomllib.load(f)
+
+
+# Allowed keys per config file section, mapped to their value converters
+_LLM_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    'provider': str,
+    'model': str,
+    'api_key': str,
+    'base_url': str,
+    'temperature': float,
+    'max_tokens': int,
+    'timeout': int,
+}
+
+_CODER_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    'type': str,
+    'auto_apply': bool,
+    'show_diffs': bool,
+    'backup_files': bool,
+}
+
+_REPOSITORY_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    'auto_commit': bool,
+    'commit_message_template': str,
+    'ignore_patterns': list,
+}
+
+_UI_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    'theme': str,
+    'show_line_numbers': bool,
+    'syntax_highlighting': bool,
+    'confirm_changes': bool,
+    'verbose': bool,
+}
+
+
+def _apply_section(section_data: Dict[str, Any], target: Any, fields: Dict[str, Callable[[Any], Any]]) -> None:
+    """Copy known keys from a config section onto a settings object, ignoring unknown keys."""
+    for key, value in section_data.items():
+        converter = fields.get(key)
+        if converter is not None:
+            setattr(target, key, converter(value))
+
+
 def get_config_path() -> Path:
     """Get the path to the configuration file."""
     # Check for config in current directory first
@@ -187,8 +239,12 @@ def get_config_path() -> Path:
     return config_dir / 'config.toml'
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> AppSettings:
-    """Load settings from file and environment."""
+    """Load settings from file and environment.
+
+    The result is cached for the lifetime of the process.
+    """
     # Start with file settings
     config_path = get_config_path()
     settings = AppSettings.load_from_file(config_path)
@@ -1,10 +1,12 @@
 """Dependency injection container for managing service dependencies."""
 
-from typing import Dict, Type, Any, TypeVar, Callable, Optional
-import inspect
+from typing import Dict, List, Tuple, Type, Any, TypeVar, Callable, Optional
 
 T = TypeVar('T')
 
+# Sentinel for singleton lookups, since None is a valid registered instance
+_MISSING = object()
+
 
 class Container:
     """Simple dependency injection container."""
@@ -13,6 +15,8 @@ class Container:
         self._services: Dict[Type, Any] = {}
         self._singletons: Dict[Type, Any] = {}
         self._factories: Dict[Type, Callable] = {}
+        # Implementation -> (param_name, annotation, has_default) for annotated __init__ params
+        self._dependencies: Dict[Type, List[Tuple[str, Any, bool]]] = {}
     
     def register(self, interface: Type[T], implementation: Type[T], singleton: bool = False) -> None:
         """Register a service implementation."""
@@ -29,12 +33,14 @@ class Container:
     def get(self, interface: Type[T]) -> T:
         """Get a service instance."""
         # Check if we have a singleton instance
-        if interface in self._singletons:
-            return self._singletons[interface]
+        instance = self._singletons.get(interface, _MISSING)
+        if instance is not _MISSING:
+            return instance
         
         # Check if we have a factory
-        if interface in self._factories:
-            factory, is_singleton = self._factories[interface]
+        registration = self._factories.get(interface)
+        if registration is not None:
+            factory, is_singleton = registration
             instance = factory()
             
             if is_singleton:
@@ -43,10 +49,11 @@ class Container:
             return instance
         
         # Check if we have a registered service
-        if interface not in self._services:
+        registration = self._services.get(interface)
+        if registration is None:
             raise ValueError(f"Service {interface.__name__} not registered")
         
-        implementation, is_singleton = self._services[interface]
+        implementation, is_singleton = registration
         instance = self._create_instance(implementation)
         
         if is_singleton:
@@ -56,31 +63,58 @@ class Container:
     
     def _create_instance(self, implementation: Type[T]) -> T:
         """Create an instance with dependency injection."""
-        # Get constructor signature
-        sig = inspect.signature(implementation.__init__)
+        dependencies = self._dependencies.get(implementation)
+        if dependencies is None:
+            dependencies = self._dependencies[implementation] = self._inspect_dependencies(implementation)
         
         # Build constructor arguments
         kwargs = {}
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-            
-            # Try to resolve the parameter type
-            if param.annotation != inspect.Parameter.empty:
-                try:
-                    kwargs[param_name] = self.get(param.annotation)
-                except ValueError:
-                    # If we can't resolve it and there's no default, raise an error
-                    if param.default == inspect.Parameter.empty:
-                        raise ValueError(f"Cannot resolve dependency {param.annotation} for {implementation}")
+        for param_name, annotation, has_default in dependencies:
+            try:
+                kwargs[param_name] = self.get(annotation)
+            except ValueError:
+                # If we can't resolve it and there's no default, raise an error
+                if not has_default:
+                    raise ValueError(f"Cannot resolve dependency {annotation} for {implementation}")
         
         return implementation(**kwargs)
     
+    @staticmethod
+    def _inspect_dependencies(implementation: Type) -> List[Tuple[str, Any, bool]]:
+        """Read the annotated constructor parameters of an implementation.
+        
+        Uses the function's code object directly so the container doesn't need
+        to import ``inspect``.
+        """
+        init = implementation.__init__
+        code = getattr(init, '__code__', None)
+        if code is None:
+            # Inherited C-level __init__ (e.g. object.__init__) takes nothing to inject
+            return []
+        
+        annotations = getattr(init, '__annotations__', {})
+        positional_count = code.co_argcount
+        first_default = positional_count - len(init.__defaults__ or ())
+        keyword_defaults = init.__kwdefaults__ or {}
+        
+        # Positional parameters (minus self) followed by keyword-only ones
+        names = code.co_varnames[:positional_count + code.co_kwonlyargcount]
+        return [
+            (
+                param_name,
+                annotations[param_name],
+                index >= first_default if index < positional_count else param_name in keyword_defaults
+            )
+            for index, param_name in enumerate(names)
+            if index and param_name in annotations
+        ]
+    
     def clear(self) -> None:
         """Clear all registrations."""
         self._services.clear()
         self._singletons.clear()
         self._factories.clear()
+        self._dependencies.clear()
 
 
 # Global container instance
@@ -1,11 +1,40 @@
 """Domain models for the core business logic."""
 
+import hashlib
+import sys
+import weakref
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Callable, MutableSequence
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from enum import Enum
 
-from ..interfaces.llm_provider import ChatMessage
+from ..interfaces.llm_provider import ChatMessage, MessageRole
+from ...utils.file_utils import count_lines
+
+
+class _PooledContent:
+    """A file body held in the shared content pool."""
+    
+    __slots__ = ('text', '__weakref__')
+    
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+# Content-addressed store of file bodies shared by all CodeContext instances;
+# an entry lives only as long as some context still references it
+_CONTENT_POOL: "weakref.WeakValueDictionary[bytes, _PooledContent]" = weakref.WeakValueDictionary()
+
+
+def _store_content(content: str) -> _PooledContent:
+    """Return the pooled entry for content, adding it if needed."""
+    digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    entry = _CONTENT_POOL.get(digest)
+    if entry is None:
+        entry = _CONTENT_POOL[digest] = _PooledContent(content)
+    return entry
 
 
 class SessionStatus(Enum):
@@ -16,71 +45,143 @@ class SessionStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSession:
     """Represents an active chat session."""
     id: str
     created_at: datetime
     status: SessionStatus = SessionStatus.ACTIVE
-    messages: List[ChatMessage] = field(default_factory=list)
+    messages: MutableSequence[ChatMessage] = field(default_factory=list)
     active_files: List[str] = field(default_factory=list)
     context: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    max_messages: Optional[int] = None
+    prompt_blocks: Dict[str, str] = field(default_factory=dict)  # file_path -> system prompt block
+    _context_size: int = field(default=0, init=False, repr=False, compare=False)
+    _append_message: Callable[[ChatMessage], None] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._context_size = sum(len(str(value)) for value in self.context.values())
+        if self.max_messages is not None or not isinstance(self.messages, list):
+            # Capped history: the oldest messages drop off in O(1)
+            self.messages = deque(self.messages, maxlen=self.max_messages)
+        # Cache the bound append; add_message runs for every turn
+        self._append_message = self.messages.append
     
     def add_message(self, message: ChatMessage) -> None:
-        """Add a message to the session."""
-        self.messages.append(message)
+        """Add a message to the session.
+        
+        When the history is capped, a leading system message stays pinned and
+        the oldest message after it is dropped instead.
+        """
+        messages = self.messages
+        if len(messages) == self.max_messages > 1 and messages[0].role is MessageRole.SYSTEM:
+            # Move the system message over the oldest turn, freeing one slot
+            messages[0] = messages.popleft()
+        self._append_message(message)
     
     def get_message_count(self) -> int:
         """Get the total number of messages in the session."""
         return len(self.messages)
     
+    def get_recent_messages(self, count: int) -> List[ChatMessage]:
+        """Get the last ``count`` messages as a list."""
+        start = max(len(self.messages) - count, 0)
+        return list(islice(self.messages, start, None))
+    
+    def set_context(self, key: str, value: Any) -> None:
+        """Set a context entry, keeping the context size up to date."""
+        if key in self.context:
+            self._context_size -= len(str(self.context[key]))
+        self.context[key] = value
+        self._context_size += len(str(value))
+    
+    def update_context(self, values: Dict[str, Any]) -> None:
+        """Merge several entries into the context."""
+        for key, value in values.items():
+            self.set_context(key, value)
+    
+    def clear_context(self) -> None:
+        """Remove all entries from the context."""
+        self.context.clear()
+        self.prompt_blocks.clear()
+        self._context_size = 0
+    
     def get_context_size(self) -> int:
-        """Get the size of the context in characters."""
-        return len(str(self.context))
+        """Get the size of the context in characters.
+        
+        The size is tracked incrementally, so context changes must go through
+        ``set_context``/``update_context``/``clear_context``.
+        """
+        return self._context_size
 
 
-@dataclass
+@dataclass(slots=True)
 class Workspace:
     """Represents a workspace/project."""
     root_path: str
     name: str
-    files: List[str] = field(default_factory=list)
+    files: Set[str] = field(default_factory=set)
     languages: List[str] = field(default_factory=list)
     is_git_repo: bool = False
     git_branch: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _add: Callable[[str], None] = field(init=False, repr=False, compare=False)
+    _discard: Callable[[str], None] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._add = self.files.add
+        self._discard = self.files.discard
     
     def add_file(self, file_path: str) -> None:
         """Add a file to the workspace."""
-        if file_path not in self.files:
-            self.files.append(file_path)
+        self._add(sys.intern(file_path))
     
     def remove_file(self, file_path: str) -> None:
         """Remove a file from the workspace."""
-        if file_path in self.files:
-            self.files.remove(file_path)
+        self._discard(file_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeContext:
-    """Represents code context for a conversation."""
-    files: Dict[str, str]  # file_path -> content
+    """Represents code context for a conversation.
+    
+    File bodies are stored once in a content-addressed pool shared by all
+    contexts; ``files`` maps each path to its pooled content entry, which is
+    released once no context refers to it.
+    """
+    files: Dict[str, Any]  # file_path -> pooled content
     functions: List[Dict[str, Any]] = field(default_factory=list)
     classes: List[Dict[str, Any]] = field(default_factory=list)
     imports: List[str] = field(default_factory=list)
     dependencies: List[str] = field(default_factory=list)
+    _total_lines: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Accept raw contents at construction time and move them into the pool
+        for file_path, value in list(self.files.items()):
+            if isinstance(value, str):
+                self.files[file_path] = _store_content(value)
+        self._total_lines = sum(count_lines(entry.text) for entry in self.files.values())
     
     def add_file_content(self, file_path: str, content: str) -> None:
         """Add file content to the context."""
-        self.files[file_path] = content
+        previous = self.files.get(file_path)
+        if previous is not None:
+            self._total_lines -= count_lines(previous.text)
+        self.files[sys.intern(file_path)] = _store_content(content)
+        self._total_lines += count_lines(content)
+    
+    def get_content(self, file_path: str) -> str:
+        """Get the content of a file in the context."""
+        return self.files[file_path].text
     
     def get_total_lines(self) -> int:
         """Get total lines of code in context."""
-        return sum(len(content.splitlines()) for content in self.files.values())
+        return self._total_lines
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeSet:
     """Represents a set of related changes."""
     id: str
@@ -1,6 +1,8 @@
 """Core coder interface defining the contract for all code editing implementations."""
 
 from abc import ABC, abstractmethod
+import asyncio
+import sys
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
@@ -14,7 +16,7 @@ class ChangeType(Enum):
     RENAME = "rename"
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeChange:
     """Represents a single code change to be applied."""
     file_path: str
@@ -24,9 +26,13 @@ class CodeChange:
     line_start: Optional[int] = None
     line_end: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    def __post_init__(self) -> None:
+        # Paths are compared and hashed repeatedly as changes flow through the app
+        self.file_path = sys.intern(self.file_path)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating proposed changes."""
     is_valid: bool
@@ -64,6 +70,10 @@ class ICoder(ABC):
         """Apply validated changes to the codebase."""
         pass
     
+    async def apply_changes_async(self, changes: List[CodeChange]) -> bool:
+        """Apply validated changes without blocking the event loop."""
+        return await asyncio.to_thread(self.apply_changes, changes)
+    
     @abstractmethod
     def generate_prompt(self, context: Dict[str, Any]) -> str:
         """Generate the prompt template for this coder format."""
@@ -1,6 +1,7 @@
 """LLM provider interface for abstracting different language model implementations."""
 
 from abc import ABC, abstractmethod
+import asyncio
 from typing import List, Optional, Dict, Any, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
@@ -84,6 +85,15 @@ class ILLMProvider(ABC):
         """Generate a response from the LLM."""
         pass
     
+    async def generate_response_async(
+        self,
+        messages: List[ChatMessage],
+        model_name: str,
+        config: Optional[GenerationConfig] = None
+    ) -> GenerationResult:
+        """Generate a response without blocking the event loop."""
+        return await asyncio.to_thread(self.generate_response, messages, model_name, config)
+    
     @abstractmethod
     async def generate_response_stream(
         self,
@@ -94,6 +104,10 @@ class ILLMProvider(ABC):
         """Generate a streaming response from the LLM."""
         pass
     
+    async def warmup(self) -> None:
+        """Open connections ahead of the first request; does nothing by default."""
+        pass
+    
     @abstractmethod
     def validate_api_key(self) -> bool:
         """Validate that the API key is valid and working."""
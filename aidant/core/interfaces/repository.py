@@ -1,7 +1,8 @@
 """Repository interface for abstracting version control and file system operations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -16,7 +17,7 @@ class FileStatus(Enum):
     COPIED = "copied"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file in the repository."""
     path: str
@@ -26,7 +27,7 @@ class FileInfo:
     content_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     """Information about a commit."""
     hash: str
@@ -66,6 +67,10 @@ class IRepository(ABC):
         """Get repository context for the given files."""
         pass
     
+    async def get_context_async(self, file_paths: List[str]) -> Dict[str, Any]:
+        """Get repository context without blocking the event loop."""
+        return await asyncio.to_thread(self.get_context, file_paths)
+    
     @abstractmethod
     def get_status(self) -> List[FileInfo]:
         """Get the status of all files in the repository."""
@@ -81,6 +86,10 @@ class IRepository(ABC):
         """Get recent commit history."""
         pass
     
+    def iter_commit_history(self, limit: int = 10) -> Iterator[CommitInfo]:
+        """Iterate over recent commits, newest first."""
+        return iter(self.get_commit_history(limit))
+    
     @abstractmethod
     def get_diff(self, file_path: str, commit_hash: Optional[str] = None) -> str:
         """Get diff for a file."""
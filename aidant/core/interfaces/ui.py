@@ -1,7 +1,7 @@
 """User interface interface for abstracting different UI implementations."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -16,6 +16,13 @@ class MessageType(Enum):
     SUCCESS = "success"
 
 
+# Bound once so the show_* helpers skip the enum attribute lookup
+_INFO = MessageType.INFO
+_WARNING = MessageType.WARNING
+_ERROR = MessageType.ERROR
+_SUCCESS = MessageType.SUCCESS
+
+
 @dataclass
 class UserChoice:
     """Represents a choice presented to the user."""
@@ -32,21 +39,34 @@ class IUserInterface(ABC):
         """Display a message to the user."""
         pass
     
+    def show_lines(self, lines: List[str], message_type: MessageType = MessageType.INFO) -> None:
+        """Display several messages of the same type."""
+        for line in lines:
+            self.show_message(line, message_type)
+    
+    def show_stream_chunk(self, chunk: str) -> None:
+        """Display part of a streamed assistant response as it arrives."""
+        pass
+    
+    def end_stream(self, content: str) -> None:
+        """Finish a streamed response; shows the full text by default."""
+        self.show_message(content)
+    
     def show_info(self, message: str) -> None:
         """Display an info message."""
-        self.show_message(message, MessageType.INFO)
+        self.show_message(message, _INFO)
     
     def show_warning(self, message: str) -> None:
         """Display a warning message."""
-        self.show_message(message, MessageType.WARNING)
+        self.show_message(message, _WARNING)
     
     def show_error(self, message: str) -> None:
         """Display an error message."""
-        self.show_message(message, MessageType.ERROR)
+        self.show_message(message, _ERROR)
     
     def show_success(self, message: str) -> None:
         """Display a success message."""
-        self.show_message(message, MessageType.SUCCESS)
+        self.show_message(message, _SUCCESS)
     
     @abstractmethod
     def get_user_input(self, prompt: str = "> ") -> str:
@@ -98,6 +118,11 @@ class IUserInterface(ABC):
         """Display file content with syntax highlighting."""
         pass
     
+    def show_file_contents(self, files: List[Tuple[str, str]]) -> None:
+        """Display several (file_path, content) pairs with syntax highlighting."""
+        for file_path, content in files:
+            self.show_file_content(file_path, content)
+    
     @abstractmethod
     def show_help(self) -> None:
         """Show help information."""
@@ -1,15 +1,43 @@
 """Core chat service that orchestrates the conversation flow."""
 
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
+import threading
 from datetime import datetime
-import uuid
+from secrets import token_hex
 
-from ..interfaces.coder import ICoder, CodeChange
+from ..interfaces.coder import ICoder, CodeChange, ChangeType
 from ..interfaces.llm_provider import ILLMProvider, ChatMessage, MessageRole, GenerationConfig
 from ..interfaces.repository import IRepository
 from ..interfaces.ui import IUserInterface
 from ..domain.models import ChatSession, SessionStatus
+from ...utils.streaming import batch_chunks
+
+
+logger = logging.getLogger(__name__)
+
+# Markers of code changes in a response; substring checks beat a regex alternation here
+_CHANGE_INDICATORS = (
+    "<<<<<<< SEARCH",
+    ">>>>>>> REPLACE",
+    "```diff",
+    "--- a/",
+    "+++ b/"
+)
+
+
+# Commit message verb for a single-file change
+_COMMIT_VERBS = {
+    ChangeType.CREATE: "Add",
+    ChangeType.MODIFY: "Update",
+    ChangeType.DELETE: "Remove"
+}
+
+# Roles used per turn, bound once instead of looked up on the enum each time
+_SYSTEM = MessageRole.SYSTEM
+_USER = MessageRole.USER
+_ASSISTANT = MessageRole.ASSISTANT
 
 
 class ChatService:
@@ -26,22 +54,31 @@ class ChatService:
         self.coder = coder
         self.repository = repository
         self.ui = ui
-        self.logger = logging.getLogger(__name__)
         
         self.current_session: Optional[ChatSession] = None
         self.generation_config = GenerationConfig(temperature=0.7)
+        # Messages kept per session, including the pinned system prompt; None keeps all
+        self.max_history: Optional[int] = None
+        
+        # Runs in a background thread for the life of the service, so async provider
+        # clients keep their connections and can warm up while the user types
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def start_session(self, initial_files: Optional[List[str]] = None) -> ChatSession:
         """Start a new chat session."""
-        session_id = str(uuid.uuid4())
+        session_id = token_hex(16)
         
-        # Get repository context
-        repo_context = self.repository.get_context(initial_files or [])
+        # Get repository context, reading the initial files concurrently
+        repo_context = self._run(self.repository.get_context_async(initial_files or []))
+        prompt_blocks = {
+            file_path: self._build_file_block(file_path, content)
+            for file_path, content in repo_context.get('file_contents', {}).items()
+        }
         
         # Create system message with coder instructions
         system_message = ChatMessage(
-            role=MessageRole.SYSTEM,
-            content=self._build_system_prompt(repo_context)
+            role=_SYSTEM,
+            content=self._build_system_prompt(repo_context, prompt_blocks)
         )
         
         self.current_session = ChatSession(
@@ -50,10 +87,15 @@ class ChatService:
             status=SessionStatus.ACTIVE,
             messages=[system_message],
             context=repo_context,
-            active_files=initial_files or []
+            active_files=initial_files or [],
+            max_messages=self.max_history,
+            prompt_blocks=prompt_blocks
         )
         
-        self.logger.info(f"Started chat session {session_id}")
+        # Open the provider's connection while the user types the first message
+        asyncio.run_coroutine_threadsafe(self.llm_provider.warmup(), self._get_loop())
+        
+        logger.info(f"Started chat session {session_id}")
         return self.current_session
     
     def process_user_message(self, user_input: str, model_name: str) -> str:
@@ -63,11 +105,11 @@ class ChatService:
         
         try:
             # Add user message to session
-            user_message = ChatMessage(role=MessageRole.USER, content=user_input)
+            user_message = ChatMessage(role=_USER, content=user_input)
             self.current_session.add_message(user_message)
             
             # Get LLM response
-            self.logger.info(f"Generating response with model {model_name}")
+            logger.info(f"Generating response with model {model_name}")
             result = self.llm_provider.generate_response(
                 messages=self.current_session.messages,
                 model_name=model_name,
@@ -84,26 +126,92 @@ class ChatService:
             return result.message.content
             
         except Exception as e:
-            self.logger.error(f"Error processing user message: {str(e)}")
+            logger.error(f"Error processing user message: {str(e)}")
+            self.current_session.status = SessionStatus.ERROR
+            raise
+    
+    def process_user_message_stream(self, user_input: str, model_name: str) -> str:
+        """Process a user message, showing the assistant's response as it streams."""
+        if not self.current_session:
+            raise ValueError("No active chat session")
+        
+        try:
+            user_message = ChatMessage(role=_USER, content=user_input)
+            self.current_session.add_message(user_message)
+            
+            logger.info(f"Streaming response with model {model_name}")
+            content = self._run(self._stream_response(model_name))
+            
+            # Record the whole response once the stream has finished
+            self.current_session.add_message(ChatMessage(role=_ASSISTANT, content=content))
+            
+            if self._contains_code_changes(content):
+                self._handle_code_changes(content)
+            
+            return content
+            
+        except Exception as e:
+            logger.error(f"Error processing user message: {str(e)}")
             self.current_session.status = SessionStatus.ERROR
             raise
     
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the service's event loop, starting its thread on first use."""
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="aidant-chat-loop", daemon=True).start()
+            self._loop = loop
+        return self._loop
+    
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine on the service's event loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result()
+        except BaseException:
+            # Ctrl+C while waiting must not leave the coroutine running
+            future.cancel()
+            raise
+    
+    async def _stream_response(self, model_name: str) -> str:
+        """Show response chunks as they arrive and return the full text."""
+        parts: List[str] = []
+        stream = self.llm_provider.generate_response_stream(
+            messages=self.current_session.messages,
+            model_name=model_name,
+            config=self.generation_config
+        )
+        async for chunk in batch_chunks(stream):
+            if not parts:
+                self.ui.stop_spinner()
+            self.ui.show_stream_chunk(chunk)
+            parts.append(chunk)
+        
+        content = "".join(parts)
+        self.ui.end_stream(content)
+        return content
+    
     def add_files_to_context(self, file_paths: List[str]) -> None:
         """Add files to the current session context."""
         if not self.current_session:
             raise ValueError("No active chat session")
         
-        # Get file contents
-        new_context = self.repository.get_context(file_paths)
+        # Get file contents, read concurrently
+        new_context = self._run(self.repository.get_context_async(file_paths))
         
         # Update session context
-        self.current_session.context.update(new_context)
-        self.current_session.active_files.extend(file_paths)
+        session = self.current_session
+        session.update_context(new_context)
+        session.active_files.extend(file_paths)
+        
+        # Only the newly added files need their prompt blocks built
+        for file_path, content in new_context.get('file_contents', {}).items():
+            session.prompt_blocks[file_path] = self._build_file_block(file_path, content)
         
         # Update system message with new context
-        self.current_session.messages[0] = ChatMessage(
-            role=MessageRole.SYSTEM,
-            content=self._build_system_prompt(self.current_session.context)
+        session.messages[0] = ChatMessage(
+            role=_SYSTEM,
+            content=self._build_system_prompt(session.context, session.prompt_blocks)
         )
     
     def get_session_summary(self) -> Dict[str, Any]:
@@ -119,7 +227,7 @@ class ChatService:
             "context_size": self.current_session.get_context_size()
         }
     
-    def _build_system_prompt(self, repo_context: Dict[str, Any]) -> str:
+    def _build_system_prompt(self, repo_context: Dict[str, Any], prompt_blocks: Dict[str, str]) -> str:
         """Build the system prompt with repository context and coder instructions."""
         base_prompt = f"""You are an AI pair programming assistant. You help users edit code in their repository.
 
@@ -138,27 +246,22 @@ Guidelines:
 5. Follow the project's existing code style
 """
         
-        # Add file context if available
-        if repo_context.get('file_contents'):
-            base_prompt += "\n\nCurrent file contents:\n"
-            for file_path, content in repo_context['file_contents'].items():
-                # Truncate very long files
-                if len(content) > 2000:
-                    content = content[:2000] + "\n... (truncated)"
-                base_prompt += f"\n--- {file_path} ---\n{content}\n"
+        if not prompt_blocks:
+            return base_prompt
         
-        return base_prompt
+        # Add file context with one join so the prompt is copied only once
+        return "".join([base_prompt, "\n\nCurrent file contents:\n", *prompt_blocks.values()])
+    
+    def _build_file_block(self, file_path: str, content: str) -> str:
+        """Build the system prompt section for one file."""
+        # Truncate very long files
+        if len(content) > 2000:
+            content = content[:2000] + "\n... (truncated)"
+        return f"\n--- {file_path} ---\n{content}\n"
     
     def _contains_code_changes(self, response: str) -> bool:
         """Check if the response contains code changes."""
-        change_indicators = [
-            "<<<<<<< SEARCH",
-            ">>>>>>> REPLACE",
-            "```diff",
-            "--- a/",
-            "+++ b/"
-        ]
-        return any(indicator in response for indicator in change_indicators)
+        return any(indicator in response for indicator in _CHANGE_INDICATORS)
     
     def _handle_code_changes(self, response: str) -> None:
         """Handle code changes found in the LLM response."""
@@ -185,8 +288,8 @@ Guidelines:
             
             # Show changes to user and get confirmation
             if self.ui.confirm_changes(changes):
-                # Apply changes
-                success = self.coder.apply_changes(changes)
+                # Apply changes, with different files written concurrently
+                success = self._run(self.coder.apply_changes_async(changes))
                 
                 if success:
                     # Commit changes to repository
@@ -194,26 +297,23 @@ Guidelines:
                     commit_hash = self.repository.commit_changes(changes, commit_message)
                     
                     self.ui.show_success(f"Changes applied and committed: {commit_hash}")
-                    self.logger.info(f"Applied {len(changes)} changes, commit: {commit_hash}")
+                    logger.info(f"Applied {len(changes)} changes, commit: {commit_hash}")
                 else:
                     self.ui.show_error("Failed to apply changes")
             else:
                 self.ui.show_info("Changes cancelled by user")
                 
         except Exception as e:
-            self.logger.error(f"Error handling code changes: {str(e)}")
+            logger.error(f"Error handling code changes: {str(e)}")
             self.ui.show_error(f"Error processing changes: {str(e)}")
     
     def _generate_commit_message(self, changes: List[CodeChange]) -> str:
         """Generate a commit message based on the changes."""
         if len(changes) == 1:
             change = changes[0]
-            if change.change_type.value == "create":
-                return f"Add {change.file_path}"
-            elif change.change_type.value == "modify":
-                return f"Update {change.file_path}"
-            elif change.change_type.value == "delete":
-                return f"Remove {change.file_path}"
+            verb = _COMMIT_VERBS.get(change.change_type)
+            if verb:
+                return f"{verb} {change.file_path}"
         
         # Multiple changes
         file_count = len(set(change.file_path for change in changes))
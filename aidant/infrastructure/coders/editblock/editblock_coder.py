@@ -1,7 +1,12 @@
 """EditBlock coder implementation."""
 
 import re
-from typing import List, Dict, Any
+import os
+import mmap
+import stat
+import asyncio
+import tempfile
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
 
 from ....core.interfaces.coder import (
@@ -9,19 +14,164 @@ from ....core.interfaces.coder import (
 )
 
 
+# SEARCH/REPLACE block markers; a block starts at the beginning of a line
+_SEARCH_MARKER = '\n<<<<<<< SEARCH\n'
+_DIVIDER_MARKER = '\n=======\n'
+_REPLACE_MARKER = '\n>>>>>>> REPLACE'
+
+# Fenced new-file block: filename line, then the file content
+_CREATE_RE = re.compile(
+    r'```(?:[\w+]*\n)?(.*?)\n(.*?)```',
+    re.DOTALL | re.MULTILINE
+)
+
+# Filename-looking token inside a noisy filename line
+_FILENAME_RE = re.compile(r'(\S+\.\w+)')
+
+# Extensions can_handle_file decides on without reading the file
+_BINARY_EXTENSIONS = frozenset({'.exe', '.bin', '.jpg', '.png', '.gif', '.pdf', '.zip', '.tar', '.gz'})
+_TEXT_EXTENSIONS = frozenset({
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.go', '.rs',
+    '.php', '.rb', '.swift', '.kt', '.scala', '.html', '.css', '.scss', '.sass',
+    '.sql', '.sh', '.bash', '.yml', '.yaml', '.json', '.xml', '.md', '.txt',
+    '.toml', '.ini', '.cfg', '.conf', '.log'
+})
+
+
+def _iter_search_replace_blocks(text: str) -> Iterator[Tuple[int, int, str, str]]:
+    """Yield (start, end, search, replace) for each SEARCH/REPLACE block in text.
+    
+    A forward scan over the three markers with str.find, so the cost stays
+    linear in the response length whatever the model sends back.
+    """
+    position = 0
+    while True:
+        start = text.find(_SEARCH_MARKER, max(position - 1, 0))
+        if start == -1:
+            return
+        search_start = start + len(_SEARCH_MARKER)
+        divider = text.find(_DIVIDER_MARKER, search_start)
+        if divider == -1:
+            return
+        replace_start = divider + len(_DIVIDER_MARKER)
+        end = text.find(_REPLACE_MARKER, replace_start)
+        if end == -1:
+            return
+        position = end + len(_REPLACE_MARKER)
+        yield start + 1, position, text[search_start:divider], text[replace_start:end]
+
+
+def _count_matches(buffer: Any, needle: bytes, limit: int = 2) -> int:
+    """Count non-overlapping occurrences of needle in buffer, stopping at limit."""
+    count = 0
+    position = buffer.find(needle)
+    while position != -1:
+        count += 1
+        if count >= limit:
+            break
+        position = buffer.find(needle, position + max(len(needle), 1))
+    return count
+
+
+def _count_search_matches(buffer: Any, search_content: str) -> int:
+    """Count up to two matches of search_content in file bytes without decoding them."""
+    matches = _count_matches(buffer, search_content.encode('utf-8'))
+    if matches or buffer.find(b'\r') == -1:
+        return matches
+    
+    # Search content uses \n; match against the text with newlines normalized
+    text = buffer[:].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return min(text.count(search_content), 2)
+
+
+def _map_file(file_path: Path, size: int) -> Any:
+    """Map a file read-only; empty files can't be mapped and read as b''."""
+    if not size:
+        return b""
+    with open(file_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _cached_stat(path: Path, cache: Dict[Path, Optional[os.stat_result]]) -> Optional[os.stat_result]:
+    """Stat a path once per cache, returning None if it doesn't exist."""
+    if path not in cache:
+        try:
+            cache[path] = os.stat(path)
+        except OSError:
+            cache[path] = None
+    return cache[path]
+
+
+def _carry_metadata(source: Path, dest: str, source_stat: os.stat_result) -> bool:
+    """Give dest the owner and extended attributes of source; False if that isn't possible."""
+    try:
+        if hasattr(os, 'chown'):
+            dest_stat = os.stat(dest)
+            if (dest_stat.st_uid, dest_stat.st_gid) != (source_stat.st_uid, source_stat.st_gid):
+                os.chown(dest, source_stat.st_uid, source_stat.st_gid)
+        
+        if hasattr(os, 'listxattr'):
+            try:
+                names = os.listxattr(source)
+            except OSError:
+                # No extended attributes on this filesystem, so nothing to carry over
+                names = []
+            for name in names:
+                os.setxattr(dest, name, os.getxattr(source, name))
+    except OSError:
+        return False
+    return True
+
+
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers see either the old or the new file.
+    
+    Symlinks are written through to their target. Hard-linked files, files in
+    a directory we can't create files in, and files whose owner or extended
+    attributes (including ACLs) can't be reproduced on a new file are
+    rewritten in place instead.
+    """
+    target = Path(os.path.realpath(file_path))
+    target_stat = os.stat(target)
+    if target_stat.st_nlink > 1:
+        # Replacing the file would detach it from its other links
+        _write_in_place(target, data)
+        return
+    
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    except PermissionError:
+        _write_in_place(target, data)
+        return
+    
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, stat.S_IMODE(target_stat.st_mode))
+        if _carry_metadata(target, tmp_path, target_stat):
+            os.replace(tmp_path, target)
+            return
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    
+    os.unlink(tmp_path)
+    _write_in_place(target, data)
+
+
+def _write_in_place(target: Path, data: bytes) -> None:
+    """Overwrite a file's contents, keeping its inode and metadata."""
+    with open(target, 'wb') as f:
+        f.write(data)
+
+
 class EditBlockCoder(ICoder):
     """Coder implementation for the EditBlock format."""
     
     def __init__(self, workspace_path: str) -> None:
         self.workspace_path = Path(workspace_path)
-        self._search_replace_pattern = re.compile(
-            r'```(?:[\w+]*\n)?(.*?)\n<<<<<<< SEARCH\n(.*?)\n=======\n(.*?)\n>>>>>>> REPLACE\n```',
-            re.DOTALL | re.MULTILINE
-        )
-        self._simple_pattern = re.compile(
-            r'(.*?)\n<<<<<<< SEARCH\n(.*?)\n=======\n(.*?)\n>>>>>>> REPLACE',
-            re.DOTALL | re.MULTILINE
-        )
     
     @property
     def name(self) -> str:
@@ -39,20 +189,16 @@ class EditBlockCoder(ICoder):
         """Parse LLM response to extract SEARCH/REPLACE blocks."""
         changes = []
         
-        # Try the fenced code block pattern first
-        matches = self._search_replace_pattern.findall(llm_response)
-        
-        # If no matches, try the simple pattern
-        if not matches:
-            matches = self._simple_pattern.findall(llm_response)
+        # Single pass over the SEARCH/REPLACE blocks, keeping the text before each one
+        matches = []
+        block_end = 0
+        for start, end, search_content, replace_content in _iter_search_replace_blocks(llm_response):
+            matches.append((llm_response[block_end:start], search_content, replace_content))
+            block_end = end
         
         if not matches:
             # Look for file creation patterns
-            create_pattern = re.compile(
-                r'```(?:[\w+]*\n)?(.*?)\n(.*?)```',
-                re.DOTALL | re.MULTILINE
-            )
-            create_matches = create_pattern.findall(llm_response)
+            create_matches = _CREATE_RE.findall(llm_response)
             
             for match in create_matches:
                 filename, content = match
@@ -70,13 +216,11 @@ class EditBlockCoder(ICoder):
                 raise ParseError("No valid SEARCH/REPLACE blocks or file creation patterns found in response")
         
         for match in matches:
-            filename, search_content, replace_content = match
-            filename = filename.strip()
+            preamble, search_content, replace_content = match
+            preamble = preamble.strip()
             
-            # Extract just the filename from the first line
-            filename_lines = filename.split('\n')
-            if filename_lines:
-                filename = filename_lines[-1].strip()  # Take the last line which should be the filename
+            # The filename is the last line before the block
+            filename = preamble[preamble.rfind('\n') + 1:].strip()
             
             if not filename:
                 raise ParseError("Filename is required for SEARCH/REPLACE blocks")
@@ -87,8 +231,7 @@ class EditBlockCoder(ICoder):
             # If filename still contains spaces or newlines, it's probably not a valid filename
             if '\n' in filename or len(filename.split()) > 1:
                 # Try to extract a filename pattern
-                import re
-                filename_pattern = re.search(r'(\S+\.\w+)', filename)
+                filename_pattern = _FILENAME_RE.search(filename)
                 if filename_pattern:
                     filename = filename_pattern.group(1)
                 else:
@@ -113,39 +256,54 @@ class EditBlockCoder(ICoder):
         errors = []
         warnings = []
         
-        for change in changes:
-            file_path = self.workspace_path / change.file_path
-            
-            # Check if file exists for modifications
-            if change.change_type == ChangeType.MODIFY:
-                if not file_path.exists():
-                    errors.append(f"File {change.file_path} does not exist")
-                    continue
+        # Several blocks often target the same file, so stat and map each path once
+        stats: Dict[Path, Optional[os.stat_result]] = {}
+        buffers: Dict[Path, Any] = {}
+        
+        try:
+            for change in changes:
+                file_path = self.workspace_path / change.file_path
                 
-                # Check if search content exists in file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_content = f.read()
+                # Check if file exists for modifications
+                if change.change_type == ChangeType.MODIFY:
+                    file_stat = _cached_stat(file_path, stats)
+                    if file_stat is None:
+                        errors.append(f"File {change.file_path} does not exist")
+                        continue
                     
-                    if change.old_content and change.old_content.strip() not in file_content:
-                        errors.append(f"Search content not found in {change.file_path}")
+                    if not change.old_content:
+                        continue
                     
-                    # Check for multiple matches
-                    if change.old_content and file_content.count(change.old_content.strip()) > 1:
-                        warnings.append(f"Multiple matches found for search content in {change.file_path}")
+                    # Check if search content exists in file, and whether it is unique
+                    try:
+                        buffer = buffers.get(file_path)
+                        if buffer is None:
+                            buffer = buffers[file_path] = _map_file(file_path, file_stat.st_size)
+                        matches = _count_search_matches(buffer, change.old_content.strip())
                         
-                except Exception as e:
-                    errors.append(f"Error reading {change.file_path}: {str(e)}")
-            
-            # Check if parent directory exists for new files
-            elif change.change_type == ChangeType.CREATE:
-                parent_dir = file_path.parent
-                if not parent_dir.exists():
-                    warnings.append(f"Parent directory {parent_dir} does not exist, will be created")
+                        if not matches:
+                            errors.append(f"Search content not found in {change.file_path}")
+                        
+                        # Check for multiple matches
+                        if matches > 1:
+                            warnings.append(f"Multiple matches found for search content in {change.file_path}")
+                            
+                    except Exception as e:
+                        errors.append(f"Error reading {change.file_path}: {str(e)}")
                 
-                # Check if file already exists
-                if file_path.exists():
-                    warnings.append(f"File {change.file_path} already exists, will be overwritten")
+                # Check if parent directory exists for new files
+                elif change.change_type == ChangeType.CREATE:
+                    parent_dir = file_path.parent
+                    if _cached_stat(parent_dir, stats) is None:
+                        warnings.append(f"Parent directory {parent_dir} does not exist, will be created")
+                    
+                    # Check if file already exists
+                    if _cached_stat(file_path, stats) is not None:
+                        warnings.append(f"File {change.file_path} already exists, will be overwritten")
+        finally:
+            for buffer in buffers.values():
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -155,40 +313,106 @@ class EditBlockCoder(ICoder):
     
     def apply_changes(self, changes: List[CodeChange]) -> bool:
         """Apply the validated changes to the filesystem."""
+        try:
+            self._apply_changes_batched(changes)
+            return True
+            
+        except Exception as e:
+            raise ApplyError(f"Failed to apply changes: {str(e)}")
+    
+    async def apply_changes_async(self, changes: List[CodeChange]) -> bool:
+        """Apply changes to different files concurrently.
+        
+        Changes to the same file are still applied in order.
+        """
+        # Group by the resolved path so that e.g. a.py and ./a.py never run concurrently
+        changes_by_file: Dict[Path, List[CodeChange]] = {}
+        for change in changes:
+            changes_by_file.setdefault(self._resolve(change), []).append(change)
+        
+        # Threads can't be cancelled, so wait for every file before reporting a failure
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._apply_changes_batched, file_changes)
+            for file_changes in changes_by_file.values()
+        ), return_exceptions=True)
+        
+        for result in results:
+            if isinstance(result, Exception):
+                raise ApplyError(f"Failed to apply changes: {str(result)}")
+            if isinstance(result, BaseException):
+                raise result
+        return True
+    
+    def _resolve(self, change: CodeChange) -> Path:
+        """Return the real path a change's file refers to."""
+        return Path(os.path.realpath(self.workspace_path / change.file_path))
+    
+    def _apply_changes_batched(self, changes: List[CodeChange]) -> None:
+        """Apply changes in order, reading and writing each modified file once.
+        
+        If a change fails, the modifications made before it are still written,
+        matching what applying the changes one at a time would leave on disk.
+        """
+        pending: Dict[Path, bytes] = {}
+        
         try:
             for change in changes:
                 file_path = self.workspace_path / change.file_path
+                real_path = self._resolve(change)
                 
                 if change.change_type == ChangeType.MODIFY:
-                    self._apply_modify_change(file_path, change)
-                elif change.change_type == ChangeType.CREATE:
-                    self._apply_create_change(file_path, change)
-                elif change.change_type == ChangeType.DELETE:
-                    self._apply_delete_change(file_path)
+                    content = pending.get(real_path)
+                    if content is None:
+                        content = file_path.read_bytes()
+                    pending[real_path] = self._modify_content(file_path, content, change)
+                    continue
                 
-            return True
-            
-        except Exception as e:
-            raise ApplyError(f"Failed to apply changes: {str(e)}")
+                # Creates and deletes must see the edits made to their file so far
+                if real_path in pending:
+                    _write_atomic(real_path, pending.pop(real_path))
+                self._apply_change(change)
+        finally:
+            for real_path, content in pending.items():
+                _write_atomic(real_path, content)
     
-    def _apply_modify_change(self, file_path: Path, change: CodeChange) -> None:
-        """Apply a modification change to a file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def _apply_change(self, change: CodeChange) -> None:
+        """Apply a file creation or deletion to the filesystem."""
+        file_path = self.workspace_path / change.file_path
+        
+        if change.change_type == ChangeType.CREATE:
+            self._apply_create_change(file_path, change)
+        elif change.change_type == ChangeType.DELETE:
+            self._apply_delete_change(file_path)
+    
+    def _modify_content(self, file_path: Path, content: bytes, change: CodeChange) -> bytes:
+        """Return the file content with a modification change applied."""
+        replacement = (change.content or "").encode('utf-8')
         
         # Replace the search content with replace content
         if change.old_content:
             search_content = change.old_content.strip()
-            if search_content not in content:
-                raise ApplyError(f"Search content not found in {file_path}")
+            needle = search_content.encode('utf-8')
             
-            new_content = content.replace(search_content, change.content or "", 1)
+            # Locate the first occurrence once and splice around it; the memoryview
+            # slices let join copy each byte once, straight into the result
+            index = content.find(needle)
+            if index != -1:
+                view = memoryview(content)
+                new_content = b"".join((view[:index], replacement, view[index + len(needle):]))
+            else:
+                # Search content uses \n; retry on the text with newlines normalized
+                text = content.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                index = text.find(search_content)
+                if index == -1:
+                    raise ApplyError(f"Search content not found in {file_path}")
+                new_content = (
+                    text[:index] + (change.content or "") + text[index + len(search_content):]
+                ).encode('utf-8')
         else:
             # If no search content, append to file
-            new_content = content + "\n" + (change.content or "")
+            new_content = content + b"\n" + replacement
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        return new_content
     
     def _apply_create_change(self, file_path: Path, change: CodeChange) -> None:
         """Apply a file creation change."""
@@ -247,29 +471,26 @@ def hello(name="World"):
         """Check if this coder can handle the given file type."""
         try:
             path = Path(file_path)
+            suffix = path.suffix.lower()
             
             # Skip binary files
-            binary_extensions = {'.exe', '.bin', '.jpg', '.png', '.gif', '.pdf', '.zip', '.tar', '.gz'}
-            if path.suffix.lower() in binary_extensions:
+            if suffix in _BINARY_EXTENSIONS:
                 return False
             
-            # Check if it's a text file by trying to read it
-            if path.exists():
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        f.read(1024)  # Try to read first 1KB
-                    return True
-                except UnicodeDecodeError:
-                    return False
+            # Known text extensions need no probe of the file itself
+            if suffix in _TEXT_EXTENSIONS:
+                return True
             
-            # For new files, assume text if extension is known
-            text_extensions = {
-                '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c', '.go', '.rs',
-                '.php', '.rb', '.swift', '.kt', '.scala', '.html', '.css', '.scss', '.sass',
-                '.sql', '.sh', '.bash', '.yml', '.yaml', '.json', '.xml', '.md', '.txt',
-                '.toml', '.ini', '.cfg', '.conf', '.log'
-            }
-            return path.suffix.lower() in text_extensions or not path.suffix
+            # Otherwise check if it's a text file by trying to read it
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    f.read(1024)  # Try to read first 1KB
+                return True
+            except FileNotFoundError:
+                # For new files, assume text if there is no extension
+                return not suffix
+            except UnicodeDecodeError:
+                return False
             
         except Exception:
-            return False
\ No newline at end of file
+            return False
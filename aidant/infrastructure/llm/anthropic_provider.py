@@ -1,6 +1,6 @@
 """Anthropic LLM provider implementation."""
 
-from typing import List, Optional, AsyncIterator
+from typing import List, Optional, AsyncIterator, Dict, Tuple
 import anthropic
 from ...core.interfaces.llm_provider import (
     ILLMProvider, ChatMessage, ModelInfo, GenerationConfig, GenerationResult,
@@ -8,12 +8,27 @@ from ...core.interfaces.llm_provider import (
 )
 
 
+# API role names, looked up per message without going through Enum.value
+_ROLE_NAMES: Dict[MessageRole, str] = {role: role.value for role in MessageRole}
+
+# Price per token by base model name (the first three dash-separated parts)
+_PRICING: Dict[str, float] = {
+    "claude-3-opus": 0.015 / 1000,  # $0.015 per 1K tokens
+    "claude-3-sonnet": 0.003 / 1000,  # $0.003 per 1K tokens
+    "claude-3-haiku": 0.00025 / 1000,  # $0.00025 per 1K tokens
+}
+_DEFAULT_PRICE = 0.003 / 1000  # Sonnet rate
+
+
 class AnthropicProvider(ILLMProvider):
     """Anthropic LLM provider implementation."""
     
     def __init__(self, api_key: str) -> None:
         self.client = anthropic.Anthropic(api_key=api_key)
+        # Streaming goes through the async client so it doesn't block the event loop
+        self.async_client = anthropic.AsyncAnthropic(api_key=api_key)
         self._models_cache: Optional[List[ModelInfo]] = None
+        self._models_by_name: Dict[str, ModelInfo] = {}
     
     @property
     def name(self) -> str:
@@ -21,16 +36,22 @@ class AnthropicProvider(ILLMProvider):
     
     @property
     def available_models(self) -> List[ModelInfo]:
+        return self._ensure_models()
+    
+    def _ensure_models(self) -> List[ModelInfo]:
+        """Return the model list, building it on first use."""
         if self._models_cache is None:
             self._models_cache = self._get_default_models()
+            self._models_by_name = {model.name: model for model in self._models_cache}
         return self._models_cache
     
     def get_model_info(self, model_name: str) -> ModelInfo:
         """Get information about a specific model."""
-        for model in self.available_models:
-            if model.name == model_name:
-                return model
-        raise ModelNotFoundError(f"Model {model_name} not found")
+        self._ensure_models()
+        try:
+            return self._models_by_name[model_name]
+        except KeyError:
+            raise ModelNotFoundError(f"Model {model_name} not found")
     
     def generate_response(
         self,
@@ -41,18 +62,7 @@ class AnthropicProvider(ILLMProvider):
         """Generate response using Anthropic API."""
         config = config or GenerationConfig()
         
-        # Separate system message from conversation
-        system_message = ""
-        conversation_messages = []
-        
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                system_message = msg.content
-            else:
-                conversation_messages.append({
-                    "role": msg.role.value,
-                    "content": msg.content
-                })
+        system_message, conversation_messages = self._prepare_messages(messages)
         
         try:
             response = self.client.messages.create(
@@ -92,35 +102,24 @@ class AnthropicProvider(ILLMProvider):
         """Generate a streaming response from Anthropic."""
         config = config or GenerationConfig()
         
-        # Separate system message from conversation
-        system_message = ""
-        conversation_messages = []
-        
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                system_message = msg.content
-            else:
-                conversation_messages.append({
-                    "role": msg.role.value,
-                    "content": msg.content
-                })
+        system_message, conversation_messages = self._prepare_messages(messages)
         
         try:
-            stream = self.client.messages.create(
+            async with self.async_client.messages.stream(
                 model=model_name,
                 max_tokens=config.max_tokens or 4096,
                 temperature=config.temperature,
                 top_p=config.top_p,
                 system=system_message,
                 messages=conversation_messages,
-                stop_sequences=config.stop_sequences,
-                stream=True
-            )
-            
-            for chunk in stream:
-                if chunk.type == "content_block_delta" and hasattr(chunk.delta, 'text'):
-                    yield chunk.delta.text
+                stop_sequences=config.stop_sequences
+            ) as stream:
+                # text_stream yields only the text deltas, no per-event attribute probing
+                async for text in stream.text_stream:
+                    yield text
                     
+        except anthropic.AuthenticationError as e:
+            raise AuthenticationError(f"Anthropic authentication failed: {str(e)}")
         except Exception as e:
             raise GenerationError(f"Anthropic streaming error: {str(e)}")
     
@@ -147,17 +146,21 @@ class AnthropicProvider(ILLMProvider):
         estimated_tokens = total_chars // 4  # Rough estimate
         
         # Anthropic pricing (simplified)
-        pricing = {
-            "claude-3-opus": 0.015 / 1000,  # $0.015 per 1K tokens
-            "claude-3-sonnet": 0.003 / 1000,  # $0.003 per 1K tokens
-            "claude-3-haiku": 0.00025 / 1000,  # $0.00025 per 1K tokens
-        }
-        
-        base_model = model_name.split("-")[0] + "-" + model_name.split("-")[1] + "-" + model_name.split("-")[2]
-        rate = pricing.get(base_model, 0.003 / 1000)  # Default to sonnet rate
+        base_model = "-".join(model_name.split("-", 3)[:3])
+        rate = _PRICING.get(base_model, _DEFAULT_PRICE)
         
         return estimated_tokens * rate
     
+    def _prepare_messages(self, messages: List[ChatMessage]) -> Tuple[str, List[Dict[str, str]]]:
+        """Separate the system message from the conversation in Anthropic's format."""
+        system_message = next((msg.content for msg in messages if msg.role is MessageRole.SYSTEM), "")
+        conversation_messages = [
+            {"role": _ROLE_NAMES[msg.role], "content": msg.content}
+            for msg in messages
+            if msg.role is not MessageRole.SYSTEM
+        ]
+        return system_message, conversation_messages
+    
     def _get_default_models(self) -> List[ModelInfo]:
         """Get default Anthropic models."""
         return [
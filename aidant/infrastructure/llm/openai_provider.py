@@ -1,20 +1,84 @@
 """OpenAI LLM provider implementation."""
 
-from typing import List, Optional, AsyncIterator
-import openai
+from typing import List, Optional, AsyncIterator, Dict, Any, Set, Tuple
 import asyncio
+import threading
+import time
+import httpx
+import openai
 from ...core.interfaces.llm_provider import (
     ILLMProvider, ChatMessage, ModelInfo, GenerationConfig, GenerationResult,
     MessageRole, ModelNotFoundError, GenerationError, AuthenticationError
 )
 
 
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# Seconds before the fetched model list is considered stale
+_MODELS_TTL = 60.0
+
+# API role names, looked up per message without going through Enum.value
+_ROLE_NAMES: Dict[MessageRole, str] = {role: role.value for role in MessageRole}
+
+# Model id prefixes that are chat models
+_CHAT_MODEL_PREFIXES = ('gpt-', 'o1-', 'o3-')
+
+# (max_tokens, context_window) by model family, checked in order
+_MODEL_LIMITS: Dict[str, Tuple[int, int]] = {
+    "gpt-4": (4096, 128000),
+    "gpt-3.5": (4096, 16385),
+    "o1": (32768, 200000),
+    "o3": (32768, 200000),
+}
+_DEFAULT_MODEL_LIMITS = (4096, 4096)
+
+# Price per token by model prefix; more specific prefixes come first
+_PRICING: Tuple[Tuple[str, float], ...] = (
+    ("gpt-4o", 0.005 / 1000),  # $0.005 per 1K tokens
+    ("gpt-4", 0.03 / 1000),  # $0.03 per 1K tokens
+    ("gpt-3.5-turbo", 0.001 / 1000),  # $0.001 per 1K tokens
+)
+_DEFAULT_PRICE = 0.01 / 1000
+
+
+def _load_encoder(model_name: str) -> Any:
+    """Load the tiktoken encoding for a model, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            # Unknown model name (e.g. via a custom base URL)
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files could not be loaded (e.g. offline)
+        return None
+
+
 class OpenAIProvider(ILLMProvider):
     """OpenAI LLM provider implementation."""
     
     def __init__(self, api_key: str, base_url: Optional[str] = None) -> None:
-        self.client = openai.OpenAI(api_key=api_key, base_url=base_url)
-        self._models_cache: Optional[List[ModelInfo]] = None
+        # Keep connections alive so later requests skip the TCP/TLS handshake
+        self._http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        self._async_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        self.client = openai.OpenAI(
+            api_key=api_key, base_url=base_url, http_client=self._http_client
+        )
+        self.async_client = openai.AsyncOpenAI(
+            api_key=api_key, base_url=base_url, http_client=self._async_http_client
+        )
+        
+        self._models_cache: Optional[Tuple[float, List[ModelInfo]]] = None
+        self._models_by_name: Dict[str, ModelInfo] = {}
+        # Token encoders by model, filled in by background loads
+        self._encoders: Dict[str, Any] = {}
+        self._loading_encoders: Set[str] = set()
     
     @property
     def name(self) -> str:
@@ -22,16 +86,24 @@ class OpenAIProvider(ILLMProvider):
     
     @property
     def available_models(self) -> List[ModelInfo]:
-        if self._models_cache is None:
-            self._models_cache = self._fetch_models()
-        return self._models_cache
+        return self._ensure_models()
+    
+    def _ensure_models(self) -> List[ModelInfo]:
+        """Return the model list, refetching it once the cache has expired."""
+        now = time.monotonic()
+        if self._models_cache is None or now - self._models_cache[0] > _MODELS_TTL:
+            models = self._fetch_models()
+            self._models_cache = (now, models)
+            self._models_by_name = {model.name: model for model in models}
+        return self._models_cache[1]
     
     def get_model_info(self, model_name: str) -> ModelInfo:
         """Get information about a specific model."""
-        for model in self.available_models:
-            if model.name == model_name:
-                return model
-        raise ModelNotFoundError(f"Model {model_name} not found")
+        self._ensure_models()
+        try:
+            return self._models_by_name[model_name]
+        except KeyError:
+            raise ModelNotFoundError(f"Model {model_name} not found")
     
     def generate_response(
         self,
@@ -40,39 +112,28 @@ class OpenAIProvider(ILLMProvider):
         config: Optional[GenerationConfig] = None
     ) -> GenerationResult:
         """Generate response using OpenAI API."""
-        config = config or GenerationConfig()
-        
-        # Convert messages to OpenAI format
-        openai_messages = [
-            {"role": msg.role.value, "content": msg.content}
-            for msg in messages
-        ]
-        
         try:
             response = self.client.chat.completions.create(
-                model=model_name,
-                messages=openai_messages,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                frequency_penalty=config.frequency_penalty,
-                presence_penalty=config.presence_penalty,
-                stop=config.stop_sequences
+                **self._completion_kwargs(messages, model_name, config)
             )
-            
-            return GenerationResult(
-                message=ChatMessage(
-                    role=MessageRole.ASSISTANT,
-                    content=response.choices[0].message.content or ""
-                ),
-                usage={
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                    "total_tokens": response.usage.total_tokens if response.usage else 0
-                },
-                finish_reason=response.choices[0].finish_reason or "unknown",
-                model_used=response.model
+            return self._to_generation_result(response)
+        except openai.AuthenticationError as e:
+            raise AuthenticationError(f"OpenAI authentication failed: {str(e)}")
+        except Exception as e:
+            raise GenerationError(f"OpenAI API error: {str(e)}")
+    
+    async def generate_response_async(
+        self,
+        messages: List[ChatMessage],
+        model_name: str,
+        config: Optional[GenerationConfig] = None
+    ) -> GenerationResult:
+        """Generate response using the async OpenAI client."""
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._completion_kwargs(messages, model_name, config)
             )
+            return self._to_generation_result(response)
         except openai.AuthenticationError as e:
             raise AuthenticationError(f"OpenAI authentication failed: {str(e)}")
         except Exception as e:
@@ -84,35 +145,72 @@ class OpenAIProvider(ILLMProvider):
         model_name: str,
         config: Optional[GenerationConfig] = None
     ) -> AsyncIterator[str]:
-        """Generate a streaming response from OpenAI."""
-        config = config or GenerationConfig()
-        
-        # Convert messages to OpenAI format
-        openai_messages = [
-            {"role": msg.role.value, "content": msg.content}
-            for msg in messages
-        ]
+        """Generate a streaming response from OpenAI.
         
+        Deltas are yielded as they arrive; ChatService batches them for display.
+        """
         try:
-            stream = self.client.chat.completions.create(
-                model=model_name,
-                messages=openai_messages,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens,
-                top_p=config.top_p,
-                frequency_penalty=config.frequency_penalty,
-                presence_penalty=config.presence_penalty,
-                stop=config.stop_sequences,
+            stream = await self.async_client.chat.completions.create(
+                **self._completion_kwargs(messages, model_name, config),
                 stream=True
             )
             
-            for chunk in stream:
+            async for chunk in stream:
                 if chunk.choices[0].delta.content:
                     yield chunk.choices[0].delta.content
                     
         except Exception as e:
             raise GenerationError(f"OpenAI streaming error: {str(e)}")
     
+    def _completion_kwargs(
+        self,
+        messages: List[ChatMessage],
+        model_name: str,
+        config: Optional[GenerationConfig]
+    ) -> Dict[str, Any]:
+        """Build chat completion request arguments."""
+        config = config or GenerationConfig()
+        
+        # Convert messages to OpenAI format
+        openai_messages = [
+            {"role": _ROLE_NAMES[msg.role], "content": msg.content}
+            for msg in messages
+        ]
+        
+        return {
+            "model": model_name,
+            "messages": openai_messages,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "top_p": config.top_p,
+            "frequency_penalty": config.frequency_penalty,
+            "presence_penalty": config.presence_penalty,
+            "stop": config.stop_sequences
+        }
+    
+    def _to_generation_result(self, response: Any) -> GenerationResult:
+        """Convert a chat completion response to a GenerationResult."""
+        return GenerationResult(
+            message=ChatMessage(
+                role=MessageRole.ASSISTANT,
+                content=response.choices[0].message.content or ""
+            ),
+            usage={
+                "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
+                "completion_tokens": response.usage.completion_tokens if response.usage else 0,
+                "total_tokens": response.usage.total_tokens if response.usage else 0
+            },
+            finish_reason=response.choices[0].finish_reason or "unknown",
+            model_used=response.model
+        )
+    
+    async def warmup(self) -> None:
+        """Establish a pooled connection to the API endpoint."""
+        try:
+            await self.async_client.with_options(timeout=5.0).models.list()
+        except Exception:
+            pass
+    
     def validate_api_key(self) -> bool:
         """Validate that the API key is valid and working."""
         try:
@@ -128,63 +226,69 @@ class OpenAIProvider(ILLMProvider):
         model_name: str
     ) -> Optional[float]:
         """Estimate the cost of generating a response."""
-        # Simplified cost estimation - in practice, you'd use actual pricing
-        total_chars = sum(len(msg.content) for msg in messages)
-        estimated_tokens = total_chars // 4  # Rough estimate: 4 chars per token
+        estimated_tokens = self._count_tokens(messages, model_name)
         
         # Basic pricing (these would be real prices in production)
-        pricing = {
-            "gpt-4": 0.03 / 1000,  # $0.03 per 1K tokens
-            "gpt-4o": 0.005 / 1000,  # $0.005 per 1K tokens
-            "gpt-3.5-turbo": 0.001 / 1000,  # $0.001 per 1K tokens
-        }
-        
-        base_model = model_name.split("-")[0] + "-" + model_name.split("-")[1] if "-" in model_name else model_name
-        rate = pricing.get(base_model, 0.01 / 1000)  # Default rate
+        rate = next(
+            (price for prefix, price in _PRICING if model_name.startswith(prefix)),
+            _DEFAULT_PRICE
+        )
         
         return estimated_tokens * rate
     
+    def _count_tokens(self, messages: List[ChatMessage], model_name: str) -> int:
+        """Count prompt tokens, falling back to ~4 chars per token without tiktoken.
+        
+        The encoder loads in the background, since tiktoken may download its
+        encoding file first; estimates use the fallback until it is ready.
+        """
+        encoder = self._encoders.get(model_name)
+        if encoder is None and model_name not in self._encoders:
+            self._load_encoder_in_background(model_name)
+        
+        if encoder is None:
+            return sum(len(msg.content) for msg in messages) // 4
+        return sum(len(encoder.encode(msg.content, disallowed_special=())) for msg in messages)
+    
+    def _load_encoder_in_background(self, model_name: str) -> None:
+        """Start loading the encoder for a model unless a load is already running."""
+        if model_name in self._loading_encoders:
+            return
+        self._loading_encoders.add(model_name)
+        
+        def load() -> None:
+            self._encoders[model_name] = _load_encoder(model_name)
+        
+        threading.Thread(target=load, name="aidant-tiktoken", daemon=True).start()
+    
     def _fetch_models(self) -> List[ModelInfo]:
         """Fetch available models from OpenAI API."""
-        models = []
         try:
             response = self.client.models.list()
-            for model in response.data:
-                if model.id.startswith(('gpt-', 'o1-', 'o3-')):
-                    models.append(ModelInfo(
-                        name=model.id,
-                        provider="openai",
-                        max_tokens=self._get_max_tokens(model.id),
-                        supports_streaming=True,
-                        supports_function_calling=True,
-                        supports_vision='vision' in model.id or 'gpt-4' in model.id,
-                        context_window=self._get_context_window(model.id)
-                    ))
+            return [
+                self._build_model_info(model.id)
+                for model in response.data
+                if model.id.startswith(_CHAT_MODEL_PREFIXES)
+            ]
         except Exception:
             # Return default models if API call fails
-            models = self._get_default_models()
-        
-        return models
-    
-    def _get_max_tokens(self, model_name: str) -> int:
-        """Get max tokens for a model."""
-        if "gpt-4" in model_name:
-            return 4096
-        elif "gpt-3.5" in model_name:
-            return 4096
-        elif "o1" in model_name or "o3" in model_name:
-            return 32768
-        return 4096
-    
-    def _get_context_window(self, model_name: str) -> int:
-        """Get context window size for a model."""
-        if "gpt-4" in model_name:
-            return 128000
-        elif "gpt-3.5" in model_name:
-            return 16385
-        elif "o1" in model_name or "o3" in model_name:
-            return 200000
-        return 4096
+            return self._get_default_models()
+    
+    def _build_model_info(self, model_name: str) -> ModelInfo:
+        """Build ModelInfo for a model returned by the API."""
+        max_tokens, context_window = next(
+            (limits for family, limits in _MODEL_LIMITS.items() if family in model_name),
+            _DEFAULT_MODEL_LIMITS
+        )
+        return ModelInfo(
+            name=model_name,
+            provider="openai",
+            max_tokens=max_tokens,
+            supports_streaming=True,
+            supports_function_calling=True,
+            supports_vision='vision' in model_name or 'gpt-4' in model_name,
+            context_window=context_window
+        )
     
     def _get_default_models(self) -> List[ModelInfo]:
         """Get default models when API is not available."""
@@ -1,15 +1,105 @@
 """Git repository implementation."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple, Mapping, Union
+from types import MappingProxyType
+import asyncio
+import threading
 import git
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 from pathlib import Path
 import os
 import mimetypes
+from stat import S_ISREG
+from collections import OrderedDict
 from datetime import datetime
 
 from ...core.interfaces.repository import (
     IRepository, FileInfo, FileStatus, CommitInfo, CommitError
 )
+from ...utils.file_utils import compile_glob_patterns, count_lines
+
+
+# Directory and file names skipped when scanning without git
+_SCAN_IGNORE = frozenset({
+    '.git', '__pycache__', '.pytest_cache', 'node_modules',
+    '.venv', 'venv', '.env', 'dist', 'build', '.DS_Store'
+})
+
+
+# Programming language by lowercase file extension
+_LANGUAGE_MAP: Mapping[str, str] = MappingProxyType({
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.html': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.sass': 'sass',
+    '.sql': 'sql',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.zsh': 'zsh',
+    '.fish': 'fish',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.md': 'markdown',
+    '.txt': 'text'
+})
+
+
+# Suffixes unknown to mimetypes whose content can be classified without reading the file
+_TEXT_SUFFIXES = frozenset(_LANGUAGE_MAP) | frozenset({
+    '.toml', '.ini', '.cfg', '.conf', '.rst', '.lock'
+})
+_BINARY_SUFFIXES = frozenset({
+    '.pyc', '.pyo', '.so', '.o', '.a', '.dll', '.dylib', '.exe', '.bin',
+    '.class', '.jar', '.whl', '.egg', '.db', '.sqlite', '.woff', '.woff2'
+})
+
+
+# Upper bound on file content kept in memory by get_file_content
+_CONTENT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+if pygit2 is not None:
+    # libgit2 status flags that do not mean "differs from HEAD"
+    _LIBGIT2_UNCHANGED = pygit2.GIT_STATUS_WT_NEW | pygit2.GIT_STATUS_IGNORED
+
+
+def _status_from_flags(flags: int) -> FileStatus:
+    """Map libgit2 status flags the same way as porcelain status codes."""
+    if flags & pygit2.GIT_STATUS_WT_NEW:
+        return FileStatus.UNTRACKED
+    if flags & (pygit2.GIT_STATUS_INDEX_MODIFIED | pygit2.GIT_STATUS_WT_MODIFIED):
+        return FileStatus.MODIFIED
+    if flags & pygit2.GIT_STATUS_INDEX_NEW:
+        return FileStatus.ADDED
+    if flags & pygit2.GIT_STATUS_INDEX_DELETED:
+        return FileStatus.DELETED
+    if flags & pygit2.GIT_STATUS_INDEX_RENAMED:
+        return FileStatus.RENAMED
+    return FileStatus.MODIFIED
 
 
 class GitRepository(IRepository):
@@ -21,6 +111,19 @@ class GitRepository(IRepository):
             self.repo = git.Repo(repo_path)
         except git.InvalidGitRepositoryError:
             self.repo = None
+        
+        # In-process libgit2 handle for status and index reads, when available
+        self._libgit2 = None
+        if self.repo is not None and pygit2 is not None:
+            try:
+                self._libgit2 = pygit2.Repository(str(self.repo_path))
+            except Exception:
+                pass
+        
+        # Path -> (mtime_ns, size, content), least recently used first
+        self._content_cache: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._cached_bytes = 0
+        self._content_lock = threading.Lock()
     
     @property
     def root_path(self) -> str:
@@ -35,13 +138,20 @@ class GitRepository(IRepository):
         files = []
         
         if self.is_git_repo:
-            # Get tracked files
+            # Get tracked files; statuses come from two git calls for the whole repo
             try:
-                tracked_files = self.repo.git.ls_files().splitlines()
+                tracked_files, modified_files = self._git_file_sets()
                 for file_path in tracked_files:
                     full_path = self.repo_path / file_path
-                    if full_path.exists() and full_path.is_file():
-                        files.append(self._create_file_info(file_path, full_path))
+                    # One stat serves both the regular-file check and FileInfo
+                    try:
+                        file_stat = full_path.stat()
+                    except OSError:
+                        continue
+                    if S_ISREG(file_stat.st_mode):
+                        files.append(self._create_file_info(
+                            file_path, full_path, tracked_files, modified_files, file_stat
+                        ))
             except Exception:
                 # Fallback to filesystem scan
                 files = self._scan_filesystem()
@@ -51,14 +161,8 @@ class GitRepository(IRepository):
         
         # Apply patterns if provided
         if patterns:
-            import fnmatch
-            filtered_files = []
-            for file_info in files:
-                for pattern in patterns:
-                    if fnmatch.fnmatch(file_info.path, pattern):
-                        filtered_files.append(file_info)
-                        break
-            files = filtered_files
+            matches = compile_glob_patterns(tuple(patterns))
+            files = [file_info for file_info in files if matches(file_info.path)]
         
         return files
     
@@ -66,19 +170,85 @@ class GitRepository(IRepository):
         """Get the content of a specific file."""
         full_path = self.repo_path / file_path
         
-        if not full_path.exists():
+        try:
+            f = open(full_path, 'rb')
+        except FileNotFoundError:
             raise FileNotFoundError(f"File {file_path} not found")
         
+        with f:
+            stat = os.fstat(f.fileno())
+            
+            # Serve unchanged files from memory
+            key = str(full_path)
+            with self._content_lock:
+                cached = self._content_cache.get(key)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    self._content_cache.move_to_end(key)
+                    return cached[2]
+            
+            data = f.read()
+        
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            content = data.decode('utf-8')
         except UnicodeDecodeError:
             # Try with different encoding
-            with open(full_path, 'r', encoding='latin-1') as f:
-                return f.read()
+            content = data.decode('latin-1')
+        
+        # Match the newline translation of text-mode reads
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        self._cache_content(key, stat, content)
+        return content
+    
+    def clear_cache(self) -> None:
+        """Drop all cached file contents."""
+        with self._content_lock:
+            self._content_cache.clear()
+            self._cached_bytes = 0
+    
+    def _cache_content(self, key: str, stat: os.stat_result, content: str) -> None:
+        """Store file content, evicting least recently used entries over the byte budget."""
+        if stat.st_size > _CONTENT_CACHE_MAX_BYTES:
+            return
+        
+        with self._content_lock:
+            previous = self._content_cache.pop(key, None)
+            if previous is not None:
+                self._cached_bytes -= previous[1]
+            
+            self._content_cache[key] = (stat.st_mtime_ns, stat.st_size, content)
+            self._cached_bytes += stat.st_size
+            
+            while self._cached_bytes > _CONTENT_CACHE_MAX_BYTES:
+                _, evicted = self._content_cache.popitem(last=False)
+                self._cached_bytes -= evicted[1]
     
     def get_context(self, file_paths: List[str]) -> Dict[str, Any]:
         """Get repository context for the given files."""
+        contents: List[Union[str, BaseException]] = []
+        for file_path in file_paths:
+            try:
+                contents.append(self.get_file_content(file_path))
+            except Exception as e:
+                contents.append(e)
+        
+        return self._build_context(file_paths, contents)
+    
+    async def get_context_async(self, file_paths: List[str]) -> Dict[str, Any]:
+        """Get repository context, reading the files concurrently."""
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self.get_file_content, file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        return self._build_context(file_paths, contents)
+    
+    def _build_context(
+        self,
+        file_paths: List[str],
+        contents: List[Union[str, BaseException]]
+    ) -> Dict[str, Any]:
+        """Assemble the context dict from file contents or read errors."""
         context = {
             "root_path": self.root_path,
             "is_git_repo": self.is_git_repo,
@@ -95,20 +265,19 @@ class GitRepository(IRepository):
             except Exception:
                 context["current_branch"] = "unknown"
         
-        # Get file contents and analyze
-        for file_path in file_paths:
-            try:
-                content = self.get_file_content(file_path)
-                context["file_contents"][file_path] = content
-                context["total_lines"] += len(content.splitlines())
-                
-                # Detect language
-                language = self._detect_language(file_path)
-                if language:
-                    context["languages"].add(language)
-                    
-            except Exception as e:
-                context["file_contents"][file_path] = f"Error reading file: {str(e)}"
+        # Analyze file contents
+        for file_path, content in zip(file_paths, contents):
+            if isinstance(content, BaseException):
+                context["file_contents"][file_path] = f"Error reading file: {str(content)}"
+                continue
+            
+            context["file_contents"][file_path] = content
+            context["total_lines"] += count_lines(content)
+            
+            # Detect language
+            language = self._detect_language(file_path)
+            if language:
+                context["languages"].add(language)
         
         context["languages"] = list(context["languages"])
         return context
@@ -121,35 +290,15 @@ class GitRepository(IRepository):
         files = []
         
         try:
-            # Get status from git
-            status = self.repo.git.status('--porcelain').splitlines()
-            
-            for line in status:
-                if len(line) < 3:
-                    continue
-                
-                status_code = line[:2]
-                file_path = line[3:]
-                
-                # Map git status codes to our enum
-                if status_code == '??':
-                    file_status = FileStatus.UNTRACKED
-                elif status_code[0] == 'M' or status_code[1] == 'M':
-                    file_status = FileStatus.MODIFIED
-                elif status_code[0] == 'A':
-                    file_status = FileStatus.ADDED
-                elif status_code[0] == 'D':
-                    file_status = FileStatus.DELETED
-                elif status_code[0] == 'R':
-                    file_status = FileStatus.RENAMED
-                else:
-                    file_status = FileStatus.MODIFIED
-                
+            for file_path, file_status in self._status_entries():
                 full_path = self.repo_path / file_path
-                if full_path.exists():
-                    file_info = self._create_file_info(file_path, full_path)
-                    file_info.status = file_status
-                    files.append(file_info)
+                try:
+                    file_stat = full_path.stat()
+                except OSError:
+                    continue
+                file_info = self._create_file_info(file_path, full_path, stat=file_stat)
+                file_info.status = file_status
+                files.append(file_info)
                     
         except Exception:
             # Fallback to regular file listing
@@ -157,6 +306,37 @@ class GitRepository(IRepository):
         
         return files
     
+    def _status_entries(self) -> Iterator[Tuple[str, FileStatus]]:
+        """Yield (path, status) for every changed or untracked file."""
+        if self._libgit2 is not None:
+            for file_path, flags in self._libgit2.status().items():
+                yield file_path, _status_from_flags(flags)
+            return
+        
+        # Get status from git
+        for line in self.repo.git.status('--porcelain').splitlines():
+            if len(line) < 3:
+                continue
+            
+            status_code = line[:2]
+            file_path = line[3:]
+            
+            # Map git status codes to our enum
+            if status_code == '??':
+                file_status = FileStatus.UNTRACKED
+            elif status_code[0] == 'M' or status_code[1] == 'M':
+                file_status = FileStatus.MODIFIED
+            elif status_code[0] == 'A':
+                file_status = FileStatus.ADDED
+            elif status_code[0] == 'D':
+                file_status = FileStatus.DELETED
+            elif status_code[0] == 'R':
+                file_status = FileStatus.RENAMED
+            else:
+                file_status = FileStatus.MODIFIED
+            
+            yield file_path, file_status
+    
     def commit_changes(self, changes: List[Any], message: str) -> str:
         """Commit changes to the repository."""
         if not self.is_git_repo:
@@ -175,23 +355,34 @@ class GitRepository(IRepository):
     
     def get_commit_history(self, limit: int = 10) -> List[CommitInfo]:
         """Get recent commit history."""
+        return list(self.iter_commit_history(limit))
+    
+    def iter_commit_history(self, limit: int = 10) -> Iterator[CommitInfo]:
+        """Iterate over recent commits, newest first."""
         if not self.is_git_repo:
-            return []
+            return
         
-        commits = []
         try:
             for commit in self.repo.iter_commits(max_count=limit):
-                commits.append(CommitInfo(
+                yield CommitInfo(
                     hash=commit.hexsha[:8],
                     message=commit.message.strip(),
                     author=str(commit.author),
                     timestamp=datetime.fromtimestamp(commit.committed_date).isoformat(),
-                    files_changed=list(commit.stats.files.keys())
-                ))
+                    files_changed=self._changed_paths(commit)
+                )
         except Exception:
-            pass
-        
-        return commits
+            return
+    
+    def _changed_paths(self, commit: git.Commit) -> List[str]:
+        """List paths changed by a commit relative to its first parent."""
+        if commit.parents:
+            revisions = (commit.parents[0].hexsha, commit.hexsha)
+        else:
+            # Root commit: diff against the empty tree
+            revisions = ('--root', commit.hexsha)
+        output = self.repo.git.diff_tree('--no-commit-id', '--name-only', '-r', '-z', *revisions)
+        return [path for path in output.split('\0') if path]
     
     def get_diff(self, file_path: str, commit_hash: Optional[str] = None) -> str:
         """Get diff for a file."""
@@ -212,6 +403,8 @@ class GitRepository(IRepository):
             return True
         
         try:
+            if self._libgit2 is not None:
+                return not self._libgit2.status(untracked_files='no')
             return not self.repo.is_dirty()
         except Exception:
             return False
@@ -220,42 +413,84 @@ class GitRepository(IRepository):
         """Scan filesystem for files when git is not available."""
         files = []
         
-        # Common patterns to ignore
-        ignore_patterns = {
-            '.git', '__pycache__', '.pytest_cache', 'node_modules',
-            '.venv', 'venv', '.env', 'dist', 'build', '.DS_Store'
-        }
+        tracked_files, modified_files = None, None
+        if self.is_git_repo:
+            try:
+                tracked_files, modified_files = self._git_file_sets()
+            except Exception:
+                pass
         
-        for file_path in self.repo_path.rglob('*'):
-            if file_path.is_file():
-                # Skip ignored directories
-                if any(part in ignore_patterns for part in file_path.parts):
-                    continue
-                
-                relative_path = file_path.relative_to(self.repo_path)
-                files.append(self._create_file_info(str(relative_path), file_path))
+        # Walk with an explicit stack so ignored directories are never entered
+        stack = [str(self.repo_path)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.name in _SCAN_IGNORE:
+                        continue
+                    
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        file_stat = entry.stat()
+                    except OSError:
+                        continue
+                    
+                    full_path = Path(entry.path)
+                    relative_path = full_path.relative_to(self.repo_path).as_posix()
+                    files.append(self._create_file_info(
+                        relative_path, full_path, tracked_files, modified_files, file_stat
+                    ))
         
         return files
     
-    def _create_file_info(self, relative_path: str, full_path: Path) -> FileInfo:
+    def _git_file_sets(self) -> Tuple[Set[str], Set[str]]:
+        """Return the tracked paths and the paths that differ from HEAD."""
+        if self._libgit2 is not None:
+            tracked = {entry.path for entry in self._libgit2.index}
+            if self._libgit2.head_is_unborn:
+                return tracked, set()
+            modified = {
+                path for path, flags in self._libgit2.status(untracked_files='no').items()
+                if flags & ~_LIBGIT2_UNCHANGED
+            }
+            return tracked, modified
+        
+        tracked = set(filter(None, self.repo.git.ls_files('-z').split('\0')))
+        try:
+            modified = set(filter(None, self.repo.git.diff('HEAD', '--name-only', '-z').split('\0')))
+        except git.GitCommandError:
+            # No HEAD commit yet
+            modified = set()
+        return tracked, modified
+    
+    def _create_file_info(
+        self,
+        relative_path: str,
+        full_path: Path,
+        tracked_files: Optional[Set[str]] = None,
+        modified_files: Optional[Set[str]] = None,
+        stat: Optional[os.stat_result] = None
+    ) -> FileInfo:
         """Create FileInfo object for a file."""
         try:
-            stat = full_path.stat()
+            if stat is None:
+                stat = full_path.stat()
             
             # Determine file status
             status = FileStatus.UNTRACKED
-            if self.is_git_repo:
-                try:
-                    # Check if file is tracked
-                    self.repo.git.ls_files(relative_path, error_unmatch=True)
-                    
-                    # Check if file is modified
-                    if self.repo.git.diff('HEAD', relative_path):
-                        status = FileStatus.MODIFIED
-                    else:
-                        status = FileStatus.ADDED
-                except git.GitCommandError:
-                    status = FileStatus.UNTRACKED
+            if tracked_files is not None and relative_path in tracked_files:
+                if modified_files and relative_path in modified_files:
+                    status = FileStatus.MODIFIED
+                else:
+                    status = FileStatus.ADDED
             
             return FileInfo(
                 path=relative_path,
@@ -279,53 +514,26 @@ class GitRepository(IRepository):
         if mime_type:
             return mime_type
         
+        # Known extensions can skip reading the file
+        suffix = file_path.suffix.lower()
+        if suffix in _TEXT_SUFFIXES:
+            return "text/plain"
+        if suffix in _BINARY_SUFFIXES:
+            return "application/octet-stream"
+        
         # Check if it's a text file
         try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(1024)
-                if b'\0' in chunk:
-                    return "application/octet-stream"  # Binary
-                return "text/plain"
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                chunk = os.read(fd, 1024)
+            finally:
+                os.close(fd)
+            if b'\0' in chunk:
+                return "application/octet-stream"  # Binary
+            return "text/plain"
         except Exception:
             return "unknown"
     
     def _detect_language(self, file_path: str) -> Optional[str]:
         """Detect programming language from file extension."""
-        suffix = Path(file_path).suffix.lower()
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.cc': 'cpp',
-            '.cxx': 'cpp',
-            '.c': 'c',
-            '.h': 'c',
-            '.hpp': 'cpp',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.scala': 'scala',
-            '.html': 'html',
-            '.css': 'css',
-            '.scss': 'scss',
-            '.sass': 'sass',
-            '.sql': 'sql',
-            '.sh': 'bash',
-            '.bash': 'bash',
-            '.zsh': 'zsh',
-            '.fish': 'fish',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.md': 'markdown',
-            '.txt': 'text'
-        }
-        return language_map.get(suffix)
\ No newline at end of file
+        return _LANGUAGE_MAP.get(os.path.splitext(file_path)[1].lower())
@@ -2,14 +2,29 @@
 
 This module provides a clean interface for all printing operations,
 ensuring separation of concerns and consistent styling throughout the application.
+
+Output is written verbatim: Rich markup and automatic highlighting are
+disabled for plain messages and on the default console.
 """
 
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Iterable, Iterator, Mapping, Tuple
+from types import MappingProxyType
+from collections import OrderedDict
 from enum import Enum
-import difflib
-from pathlib import Path
+from functools import lru_cache
+import io
+import os
+
+try:
+    # C implementation of SequenceMatcher, much faster on large files
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher as _SequenceMatcher
 
-from rich.console import Console
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+from rich.console import Console, Group
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.syntax import Syntax
@@ -31,12 +46,193 @@ class PrintStyle(Enum):
     BOLD = "bold"
 
 
+def _unified_diff(
+    a: List[str],
+    b: List[str],
+    fromfile: str,
+    tofile: str,
+    n: int = 3
+) -> Iterator[str]:
+    """Yield the lines of difflib.unified_diff(..., lineterm="") using _SequenceMatcher."""
+    started = False
+    for group in _SequenceMatcher(None, a, b).get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+        
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in b[j1:j2]:
+                    yield '+' + line
+
+
+def _git_unified_diff(
+    old_content: str,
+    new_content: str,
+    fromfile: str,
+    tofile: str,
+    n: int = 3
+) -> Optional[List[str]]:
+    """Diff with ``git diff --no-index``, or return None if git can't be used."""
+    import subprocess
+    import tempfile
+    
+    with tempfile.TemporaryDirectory(prefix="aidant-diff-") as tmp_dir:
+        old_path = os.path.join(tmp_dir, "old")
+        new_path = os.path.join(tmp_dir, "new")
+        for path, content in ((old_path, old_content), (new_path, new_content)):
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+        
+        try:
+            result = subprocess.run(
+                ["git", "diff", "--no-index", "--no-color", "--no-ext-diff", f"-U{n}", old_path, new_path],
+                capture_output=True
+            )
+        except OSError:
+            return None
+    
+    # Exit status 1 means the files differ; anything else but 0 is an error
+    if result.returncode not in (0, 1):
+        return None
+    
+    lines = result.stdout.decode("utf-8", errors="replace").splitlines()
+    
+    # Replace git's headers with ours and drop its end-of-file markers
+    for index, line in enumerate(lines):
+        if line.startswith("@@"):
+            hunks = [line for line in lines[index:] if not line.startswith("\\ No newline")]
+            return [f"--- {fromfile}", f"+++ {tofile}", *hunks]
+    return []
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Format a hunk range the way unified diffs do."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+# Spinner repaint rate; a few frames per second is enough to look alive
+_SPINNER_REFRESH_PER_SECOND = 4
+
+# Diffs longer than this are shown without syntax highlighting
+_DIFF_HIGHLIGHT_MAX_LINES = 2000
+
+# Combined size from which print_diff hands the diff to git
+_GIT_DIFF_MIN_CHARS = 64 * 1024
+
+
+# Syntax highlighting lexer by lowercase file extension
+_LANGUAGE_MAP: Mapping[str, str] = MappingProxyType({
+    '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
+    '.java': 'java', '.cpp': 'cpp', '.c': 'c', '.go': 'go',
+    '.rs': 'rust', '.php': 'php', '.rb': 'ruby', '.html': 'html',
+    '.css': 'css', '.sql': 'sql', '.sh': 'bash', '.yml': 'yaml',
+    '.yaml': 'yaml', '.json': 'json', '.xml': 'xml', '.md': 'markdown',
+    '.toml': 'toml', '.ini': 'ini', '.cfg': 'ini', '.conf': 'ini'
+})
+
+
+@lru_cache(maxsize=32)
+def _get_lexer(language: str) -> Lexer:
+    """Resolve a Pygments lexer once per language, with the options Syntax would use."""
+    try:
+        return get_lexer_by_name(language, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return get_lexer_by_name("text", stripnl=False, ensurenl=True, tabsize=4)
+
+
+class _CachedSyntax(Syntax):
+    """Syntax that tokenizes its code once and reuses the result on later renders."""
+    
+    _highlighted: Optional[Tuple[Any, Text]] = None
+    
+    def highlight(
+        self,
+        code: str,
+        line_range: Optional[Tuple[Optional[int], Optional[int]]] = None
+    ) -> Text:
+        key = (code, line_range)
+        if self._highlighted is None or self._highlighted[0] != key:
+            self._highlighted = (key, super().highlight(code, line_range))
+        # Rendering mutates the text, so hand out a copy
+        return self._highlighted[1].copy()
+
+
+# Recently rendered Syntax objects, keyed by (code, language, theme, line_numbers)
+_SYNTAX_CACHE: "OrderedDict[Tuple[str, str, str, bool], Syntax]" = OrderedDict()
+_SYNTAX_CACHE_SIZE = 128
+
+# Highlighted Text keeps a style span per token; this is a rough upper
+# estimate of the bytes retained per character of source
+_SYNTAX_BYTES_PER_CHAR = 72
+
+# Upper bound on memory held by cached highlighting
+_SYNTAX_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Code longer than this is highlighted on every render instead of cached
+_SYNTAX_CACHE_MAX_CODE_CHARS = 64 * 1024
+
+# Estimated bytes currently retained by _SYNTAX_CACHE
+_syntax_cached_bytes = 0
+
+
+def _get_syntax(code: str, language: str, theme: str, line_numbers: bool) -> Syntax:
+    """Return a cached Syntax for the code, creating it on first use."""
+    global _syntax_cached_bytes
+    
+    if len(code) > _SYNTAX_CACHE_MAX_CODE_CHARS:
+        return Syntax(code, _get_lexer(language), theme=theme, line_numbers=line_numbers)
+    
+    key = (code, language, theme, line_numbers)
+    syntax = _SYNTAX_CACHE.get(key)
+    if syntax is not None:
+        _SYNTAX_CACHE.move_to_end(key)
+        return syntax
+    
+    syntax = _CachedSyntax(code, _get_lexer(language), theme=theme, line_numbers=line_numbers)
+    _SYNTAX_CACHE[key] = syntax
+    _syntax_cached_bytes += len(code) * _SYNTAX_BYTES_PER_CHAR
+    while (
+        len(_SYNTAX_CACHE) > _SYNTAX_CACHE_SIZE
+        or _syntax_cached_bytes > _SYNTAX_CACHE_MAX_BYTES
+    ):
+        (evicted_code, _, _, _), _ = _SYNTAX_CACHE.popitem(last=False)
+        _syntax_cached_bytes -= len(evicted_code) * _SYNTAX_BYTES_PER_CHAR
+    return syntax
+
+
+def reset_syntax_cache() -> None:
+    """Drop cached syntax highlighting, e.g. after a theme change."""
+    global _syntax_cached_bytes
+    
+    _SYNTAX_CACHE.clear()
+    _syntax_cached_bytes = 0
+
+
 class RichPrinter:
     """Centralized Rich-based printer for consistent output formatting."""
     
     def __init__(self, console: Optional[Console] = None) -> None:
         """Initialize the printer with an optional console instance."""
-        self.console = console or Console()
+        # Nothing printed here relies on markup or auto-highlighting
+        self.console = console or Console(highlight=False, markup=False)
         self._spinner_live: Optional[Live] = None
     
     def print(
@@ -53,7 +249,24 @@ class RichPrinter:
             formatted_message = f"{icon} {message}"
         
         style_value = style.value if style else None
-        self.console.print(formatted_message, style=style_value, end=end)
+        self.console.print(formatted_message, style=style_value, end=end, markup=False, highlight=False)
+    
+    def print_stream_chunk(self, chunk: str) -> None:
+        """Write part of a streamed message as-is, without wrapping or a newline."""
+        self.console.out(chunk, end="", highlight=False)
+    
+    def print_lines(
+        self,
+        lines: List[str],
+        style: Optional[PrintStyle] = None,
+        icon: Optional[str] = None
+    ) -> None:
+        """Print several lines with one console call, each styled like print()."""
+        if icon:
+            lines = [f"{icon} {line}" for line in lines]
+        
+        style_value = style.value if style else None
+        self.console.print("\n".join(lines), style=style_value, markup=False, highlight=False)
     
     def print_info(self, message: str, icon: str = "ℹ️") -> None:
         """Print an info message."""
@@ -131,12 +344,7 @@ class RichPrinter:
     ) -> None:
         """Print code with syntax highlighting."""
         try:
-            syntax = Syntax(code, language, theme=theme, line_numbers=line_numbers)
-            if title:
-                panel = Panel(syntax, title=title, border_style=border_style)
-                self.console.print(panel)
-            else:
-                self.console.print(syntax)
+            self.console.print(self._build_syntax(code, language, theme, line_numbers, title, border_style))
         except Exception:
             # Fallback to plain text
             if title:
@@ -145,6 +353,21 @@ class RichPrinter:
             if title:
                 self.console.print("--- End ---\n")
     
+    def _build_syntax(
+        self,
+        code: str,
+        language: str,
+        theme: str = "monokai",
+        line_numbers: bool = True,
+        title: Optional[str] = None,
+        border_style: str = "blue"
+    ) -> Any:
+        """Build a highlighted renderable, wrapped in a panel when titled."""
+        syntax = _get_syntax(code, language, theme, line_numbers)
+        if title:
+            return Panel(syntax, title=title, border_style=border_style)
+        return syntax
+    
     def print_diff(
         self, 
         old_content: str, 
@@ -153,25 +376,50 @@ class RichPrinter:
         context_lines: int = 3
     ) -> None:
         """Print a diff between old and new content."""
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
+        diff: Optional[Iterable[str]] = None
+        if len(old_content) + len(new_content) >= _GIT_DIFF_MIN_CHARS:
+            # git's C diff is far faster than SequenceMatcher on large inputs
+            diff = _git_unified_diff(
+                old_content,
+                new_content,
+                fromfile=f"a/{file_path}",
+                tofile=f"b/{file_path}",
+                n=context_lines
+            )
+        
+        if diff is None:
+            diff = _unified_diff(
+                old_content.splitlines(), 
+                new_content.splitlines(), 
+                fromfile=f"a/{file_path}", 
+                tofile=f"b/{file_path}",
+                n=context_lines
+            )
         
-        diff = list(difflib.unified_diff(
-            old_lines, 
-            new_lines, 
-            fromfile=f"a/{file_path}", 
-            tofile=f"b/{file_path}",
-            lineterm="",
-            n=context_lines
-        ))
+        # Write the lines as they are generated instead of collecting a list
+        buffer = io.StringIO()
+        line_count = 0
+        for line in diff:
+            if line_count:
+                buffer.write("\n")
+            buffer.write(line)
+            line_count += 1
         
-        if not diff:
+        if not line_count:
             self.print_warning("No differences found.")
             return
         
-        diff_text = "".join(diff)
+        if line_count > _DIFF_HIGHLIGHT_MAX_LINES:
+            # Tokenizing a diff this long stalls the terminal; show it unhighlighted
+            self.console.print(Panel(
+                Text(buffer.getvalue()),
+                title=f"Changes to {file_path}",
+                border_style="blue"
+            ))
+            return
+        
         self.print_syntax(
-            diff_text, 
+            buffer.getvalue(), 
             "diff", 
             title=f"Changes to {file_path}",
             border_style="blue"
@@ -191,10 +439,14 @@ class RichPrinter:
         
         # Truncate content if max_lines is specified
         if max_lines:
-            lines = content.splitlines()
-            if len(lines) > max_lines:
-                content = "\n".join(lines[:max_lines])
-                content += f"\n... (truncated, showing first {max_lines} lines)"
+            # Only scan as far as the last line that will be shown
+            end = -1
+            for _ in range(max_lines):
+                end = content.find("\n", end + 1)
+                if end == -1:
+                    break
+            if end != -1 and end < len(content) - 1:
+                content = content[:end] + f"\n... (truncated, showing first {max_lines} lines)"
         
         self.print_syntax(
             content, 
@@ -203,13 +455,32 @@ class RichPrinter:
             border_style="blue"
         )
     
+    def print_file_contents(self, files: List[Tuple[str, str]]) -> None:
+        """Print several files with syntax highlighting in a single render."""
+        try:
+            panels = [
+                self._build_syntax(content, self._detect_language(file_path), title=file_path)
+                for file_path, content in files
+            ]
+            self.console.print(Group(*panels))
+        except Exception:
+            # Fallback to rendering the files one by one
+            for file_path, content in files:
+                self.print_file_content(file_path, content)
+    
     def start_spinner(self, message: str, spinner_type: str = "dots") -> None:
         """Start a loading spinner with a message."""
         if self._spinner_live:
             self.stop_spinner()
         
+        # Nothing to animate when output is piped or captured
+        if not self.console.is_terminal:
+            return
+        
         spinner = Spinner(spinner_type, text=message)
-        self._spinner_live = Live(spinner, console=self.console, refresh_per_second=10)
+        self._spinner_live = Live(
+            spinner, console=self.console, refresh_per_second=_SPINNER_REFRESH_PER_SECOND
+        )
         self._spinner_live.start()
     
     def stop_spinner(self) -> None:
@@ -238,18 +509,11 @@ class RichPrinter:
         self.console.print("", justify="center")
         self.print_separator(char, length)
     
-    def _detect_language(self, file_path: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _detect_language(file_path: str) -> str:
         """Detect programming language from file extension."""
-        ext = Path(file_path).suffix.lower()
-        language_map = {
-            '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
-            '.java': 'java', '.cpp': 'cpp', '.c': 'c', '.go': 'go',
-            '.rs': 'rust', '.php': 'php', '.rb': 'ruby', '.html': 'html',
-            '.css': 'css', '.sql': 'sql', '.sh': 'bash', '.yml': 'yaml',
-            '.yaml': 'yaml', '.json': 'json', '.xml': 'xml', '.md': 'markdown',
-            '.toml': 'toml', '.ini': 'ini', '.cfg': 'ini', '.conf': 'ini'
-        }
-        return language_map.get(ext, 'text')
+        return _LANGUAGE_MAP.get(os.path.splitext(file_path)[1].lower(), 'text')
 
 
 # Global printer instance for easy access
@@ -1,11 +1,68 @@
 """Terminal UI implementation using centralized Rich printing module."""
 
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 from pathlib import Path
 
 from ...core.interfaces.ui import IUserInterface, MessageType, UserChoice
 from ...core.interfaces.coder import CodeChange
 from ..printing import RichPrinter, PrintStyle
+from ...utils.early_input import drain_early_input, start_capturing_early_input
+from ...utils.file_utils import count_lines
+
+
+# Style and icon per message type, matching the RichPrinter print_* helpers
+_MESSAGE_STYLES = {
+    MessageType.INFO: (PrintStyle.INFO, "ℹ️"),
+    MessageType.WARNING: (PrintStyle.WARNING, "⚠️"),
+    MessageType.ERROR: (PrintStyle.ERROR, "❌"),
+    MessageType.SUCCESS: (PrintStyle.SUCCESS, "✅"),
+}
+
+
+# Panel text for show_welcome and show_help
+_WELCOME_TEXT = """🤖 Aidant - AI Pair Programming Assistant
+
+Welcome! I'm here to help you write and edit code. Here's how to get started:
+
+Commands:
+• Type your request in natural language
+• Use /add <file> to add files to the conversation
+• Use /files to see current files
+• Use /help for more commands
+• Use /exit to quit
+
+Tips:
+• Be specific about what you want to change
+• I can create new files, modify existing ones, or explain code
+• I'll show you exactly what changes I plan to make before applying them
+
+Let's start coding! What would you like to work on?"""
+
+_HELP_TEXT = """Available Commands:
+
+/add <file>     - Add a file to the conversation context
+/files          - Show files currently in context
+/clear          - Clear the conversation context
+/status         - Show repository status
+/diff <file>    - Show diff for a file
+/history        - Show recent commit history
+/help           - Show this help message
+/exit           - Exit the application
+
+Usage Examples:
+
+• "Add error handling to the login function"
+• "Create a new API endpoint for user registration"
+• "Fix the bug in the calculate_total method"
+• "Add unit tests for the User class"
+• "Refactor this code to use async/await"
+
+Tips:
+
+• Be specific about what you want to change
+• Mention file names when working with multiple files
+• Ask me to explain code if you're unsure about something
+• I'll always show you changes before applying them"""
 
 
 class TerminalInterface(IUserInterface):
@@ -13,35 +70,64 @@ class TerminalInterface(IUserInterface):
     
     def __init__(self) -> None:
         self.printer = RichPrinter()
+        self._early_lines: List[str] = []
+        self._early_partial = ""
     
     def show_message(self, message: str, message_type: MessageType = MessageType.INFO) -> None:
         """Display a message with appropriate styling."""
-        if message_type == MessageType.INFO:
-            self.printer.print_info(message)
-        elif message_type == MessageType.WARNING:
-            self.printer.print_warning(message)
-        elif message_type == MessageType.ERROR:
-            self.printer.print_error(message)
-        elif message_type == MessageType.SUCCESS:
-            self.printer.print_success(message)
-        else:
-            self.printer.print(message)
+        style, icon = _MESSAGE_STYLES.get(message_type, (None, None))
+        self.printer.print(message, style, icon)
+    
+    def show_lines(self, lines: List[str], message_type: MessageType = MessageType.INFO) -> None:
+        """Display several messages in a single render."""
+        style, icon = _MESSAGE_STYLES.get(message_type, (None, None))
+        self.printer.print_lines(lines, style, icon)
+    
+    def show_stream_chunk(self, chunk: str) -> None:
+        """Display part of a streamed assistant response as it arrives."""
+        self.printer.print_stream_chunk(chunk)
+    
+    def end_stream(self, content: str) -> None:
+        """Finish a streamed response whose chunks are already on screen."""
+        self.printer.print_stream_chunk("\n")
+        self._collect_typeahead()
     
     def get_user_input(self, prompt: str = "> ") -> str:
         """Get input from the user."""
+        # Replay anything typed during startup or while a response was generated
+        self._collect_typeahead()
+        
+        if self._early_lines:
+            line = self._early_lines.pop(0)
+            self.printer.print(f"{prompt}{line}")
+            return line
+        
+        if self._early_partial:
+            partial, self._early_partial = self._early_partial, ""
+            return self.printer.prompt(prompt, default=partial)
+        
         return self.printer.prompt(prompt)
     
+    def _collect_typeahead(self) -> None:
+        """Stop capturing keystrokes and queue what was typed for get_user_input."""
+        text = drain_early_input()
+        if text:
+            *lines, self._early_partial = (self._early_partial + text).split('\n')
+            self._early_lines.extend(lines)
+    
     def confirm(self, message: str, default: bool = False) -> bool:
         """Ask the user for confirmation."""
+        self._collect_typeahead()
         return self.printer.confirm(message, default)
     
     def choose_option(self, message: str, choices: List[UserChoice]) -> str:
         """Present multiple choices to the user."""
-        self.printer.print(f"\n{message}")
-        
+        lines = [f"\n{message}"]
         for i, choice in enumerate(choices, 1):
             description = f" - {choice.description}" if choice.description else ""
-            self.printer.print(f"  {i}. {choice.label}{description}")
+            lines.append(f"  {i}. {choice.label}{description}")
+        self.printer.print_lines(lines)
+        self._collect_typeahead()
         
         while True:
             try:
@@ -71,7 +157,7 @@ class TerminalInterface(IUserInterface):
             if change.line_start and change.line_end:
                 lines = f"{change.line_start}-{change.line_end}"
             elif change.old_content:
-                lines = str(len(change.old_content.splitlines()))
+                lines = str(count_lines(change.old_content))
             
             description = ""
             if change.change_type.value == "create":
@@ -108,6 +194,7 @@ class TerminalInterface(IUserInterface):
                 self.show_diff(change.old_content, change.content, change.file_path)
         
         self.printer.print_separator()
+        self._collect_typeahead()
         return self.printer.confirm("Apply these changes?", default=False)
     
     def show_diff(self, old_content: str, new_content: str, file_path: str) -> None:
@@ -116,6 +203,8 @@ class TerminalInterface(IUserInterface):
     
     def start_spinner(self, message: str) -> None:
         """Start a loading spinner with a message."""
+        # Let the user type their next message while waiting on the response
+        start_capturing_early_input()
         self.printer.start_spinner(message)
     
     def stop_spinner(self) -> None:
@@ -124,56 +213,16 @@ class TerminalInterface(IUserInterface):
     
     def show_welcome(self) -> None:
         """Show welcome message."""
-        welcome_text = """🤖 Aidant - AI Pair Programming Assistant
-
-Welcome! I'm here to help you write and edit code. Here's how to get started:
-
-Commands:
-• Type your request in natural language
-• Use /add <file> to add files to the conversation
-• Use /files to see current files
-• Use /help for more commands
-• Use /exit to quit
-
-Tips:
-• Be specific about what you want to change
-• I can create new files, modify existing ones, or explain code
-• I'll show you exactly what changes I plan to make before applying them
-
-Let's start coding! What would you like to work on?"""
-        
-        self.printer.print_panel(welcome_text, title="Welcome", border_style="green")
+        self.printer.print_panel(_WELCOME_TEXT, title="Welcome", border_style="green")
     
     def show_file_content(self, file_path: str, content: str, language: Optional[str] = None) -> None:
         """Display file content with syntax highlighting."""
         self.printer.print_file_content(file_path, content, language)
     
+    def show_file_contents(self, files: List[Tuple[str, str]]) -> None:
+        """Display several files in a single render."""
+        self.printer.print_file_contents(files)
+    
     def show_help(self) -> None:
         """Show help information."""
-        help_text = """Available Commands:
-
-/add <file>     - Add a file to the conversation context
-/files          - Show files currently in context
-/clear          - Clear the conversation context
-/status         - Show repository status
-/diff <file>    - Show diff for a file
-/history        - Show recent commit history
-/help           - Show this help message
-/exit           - Exit the application
-
-Usage Examples:
-
-• "Add error handling to the login function"
-• "Create a new API endpoint for user registration"
-• "Fix the bug in the calculate_total method"
-• "Add unit tests for the User class"
-• "Refactor this code to use async/await"
-
-Tips:
-
-• Be specific about what you want to change
-• Mention file names when working with multiple files
-• Ask me to explain code if you're unsure about something
-• I'll always show you changes before applying them"""
-        
-        self.printer.print_panel(help_text, title="Help", border_style="yellow")
\ No newline at end of file
+        self.printer.print_panel(_HELP_TEXT, title="Help", border_style="yellow")
\ No newline at end of file
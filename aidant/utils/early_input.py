@@ -0,0 +1,135 @@
+"""Capture keystrokes typed while the CLI is busy.
+
+Provider SDK imports, API key validation and repository loading can take a
+noticeable amount of time, and so can waiting on a model response. Anything
+the user types during those windows would otherwise be echoed over the output
+or lost, so it is buffered here and handed to the next input prompt instead.
+"""
+
+import atexit
+import codecs
+import os
+import sys
+import threading
+from typing import Callable, Optional
+
+_POLL_INTERVAL = 0.05
+
+_buffer: list = []
+_lock = threading.Lock()
+_stop_event = threading.Event()
+_thread: Optional[threading.Thread] = None
+_restore_terminal: Optional[Callable[[], None]] = None
+_atexit_registered = False
+
+
+def start_capturing_early_input() -> None:
+    """Start buffering keystrokes in the background until drained.
+
+    Does nothing if capturing is already running.
+    """
+    global _thread, _restore_terminal, _atexit_registered
+
+    if _thread is not None or not sys.stdin.isatty():
+        return
+
+    if os.name == 'nt':
+        reader = _read_windows
+    else:
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        try:
+            old_attrs = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        except termios.error:
+            return
+
+        def restore() -> None:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+        _restore_terminal = restore
+        # Capture restarts on every turn; one exit hook covers them all
+        if not _atexit_registered:
+            atexit.register(_stop)
+            _atexit_registered = True
+        reader = _read_posix
+
+    _stop_event.clear()
+    _thread = threading.Thread(target=reader, name="aidant-early-input", daemon=True)
+    _thread.start()
+
+
+def drain_early_input() -> str:
+    """Stop capturing and return everything typed so far.
+
+    Returns an empty string if capturing was never started.
+    """
+    _stop()
+    with _lock:
+        text = ''.join(_buffer)
+        _buffer.clear()
+    return _apply_backspaces(text)
+
+
+def _stop() -> None:
+    """Stop the reader thread and restore the terminal mode."""
+    global _thread, _restore_terminal
+
+    if _thread is not None:
+        _stop_event.set()
+        _thread.join()
+        _thread = None
+
+    if _restore_terminal is not None:
+        _restore_terminal()
+        _restore_terminal = None
+
+
+def _read_posix() -> None:
+    """Read raw stdin bytes until asked to stop."""
+    import select
+
+    fd = sys.stdin.fileno()
+    # A multibyte character may be split across reads
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    while not _stop_event.is_set():
+        ready, _, _ = select.select([fd], [], [], _POLL_INTERVAL)
+        if not ready:
+            continue
+        data = os.read(fd, 1024)
+        text = decoder.decode(data, final=not data)
+        if text:
+            with _lock:
+                _buffer.append(text)
+        if not data:
+            break
+
+
+def _read_windows() -> None:
+    """Poll the Windows console for keystrokes until asked to stop."""
+    import msvcrt
+
+    while not _stop_event.is_set():
+        if msvcrt.kbhit():
+            char = msvcrt.getwch()
+            with _lock:
+                _buffer.append('\n' if char == '\r' else char)
+        else:
+            _stop_event.wait(_POLL_INTERVAL)
+
+
+def _apply_backspaces(text: str) -> str:
+    """Apply backspace/delete keystrokes to the captured text."""
+    if '\x7f' not in text and '\b' not in text:
+        return text
+
+    chars: list = []
+    for char in text:
+        if char in ('\x7f', '\b'):
+            if chars:
+                chars.pop()
+        else:
+            chars.append(char)
+    return ''.join(chars)
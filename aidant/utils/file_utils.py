@@ -1,81 +1,139 @@
 """File utility functions."""
 
+import codecs
 import os
-import mimetypes
+import re
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional, Tuple, Union
+
+
+# Programming language by lowercase file extension
+_LANGUAGE_MAP: Mapping[str, str] = MappingProxyType({
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.c': 'c',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.html': 'html',
+    '.htm': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.sass': 'sass',
+    '.less': 'less',
+    '.sql': 'sql',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.zsh': 'zsh',
+    '.fish': 'fish',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.md': 'markdown',
+    '.markdown': 'markdown',
+    '.txt': 'text',
+    '.toml': 'toml',
+    '.ini': 'ini',
+    '.cfg': 'ini',
+    '.conf': 'ini'
+})
+
+
+# Suffixes that identify text or binary files without reading them
+_TEXT_SUFFIXES = frozenset(_LANGUAGE_MAP) | frozenset({
+    '.log', '.rst', '.csv', '.tsv', '.lock'
+})
+_BINARY_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.pdf',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.tar', '.whl', '.jar',
+    '.exe', '.dll', '.so', '.dylib', '.o', '.a', '.pyc', '.pyo', '.class',
+    '.bin', '.db', '.sqlite', '.woff', '.woff2', '.ttf', '.otf', '.mp3', '.mp4'
+})
+
+
+# Top-level directory count from which find_files scans subtrees in threads
+_PARALLEL_SCAN_MIN_DIRS = 4
+
+
+@lru_cache(maxsize=32)
+def compile_glob_patterns(patterns: Tuple[str, ...]) -> Callable[[str], Optional[re.Match]]:
+    """Compile fnmatch-style globs into a single matcher function.
+    
+    The returned callable behaves like ``any(fnmatch(path, p) for p in patterns)``
+    but translates the globs only once and matches with one regex.
+    """
+    if not patterns:
+        return lambda path: None
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns)).match
+
+
+def count_lines(content: str) -> int:
+    """Count lines like ``len(content.splitlines())`` for ``\n`` endings, without building a list."""
+    if not content:
+        return 0
+    return content.count('\n') + (not content.endswith('\n'))
 
 
 def is_text_file(file_path: Path) -> bool:
     """Check if a file is a text file."""
+    # Decide by extension alone when it is conclusive
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix in _BINARY_SUFFIXES:
+        return False
+    if suffix in _TEXT_SUFFIXES:
+        return True
+    
     try:
-        # Check MIME type
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if mime_type and mime_type.startswith('text/'):
-            return True
+        # Probe the content once per file version
+        stat = os.stat(file_path)
+        return _probe_text(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
         
-        # Check by reading a small chunk
-        with open(file_path, 'rb') as f:
+    except (PermissionError, OSError):
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _probe_text(path: str, mtime_ns: int, size: int) -> bool:
+    """Check the first 1 KB of a file for NUL bytes and valid UTF-8."""
+    try:
+        with open(path, 'rb') as f:
             chunk = f.read(1024)
-            if b'\0' in chunk:
-                return False  # Binary file
-            
-        # Try to decode as UTF-8
-        with open(file_path, 'r', encoding='utf-8') as f:
-            f.read(1024)
-        return True
-        
-    except (UnicodeDecodeError, PermissionError, OSError):
+    except OSError:
         return False
+    
+    if b'\0' in chunk:
+        return False  # Binary file
+    
+    # Try to decode as UTF-8, tolerating a character cut off at the chunk end
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(chunk, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
 
 
-def get_file_language(file_path: Path) -> Optional[str]:
+@lru_cache(maxsize=2048)
+def get_file_language(file_path: Union[str, Path]) -> Optional[str]:
     """Detect programming language from file extension."""
-    suffix = file_path.suffix.lower()
-    language_map = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.jsx': 'javascript',
-        '.tsx': 'typescript',
-        '.java': 'java',
-        '.cpp': 'cpp',
-        '.cc': 'cpp',
-        '.cxx': 'cpp',
-        '.c': 'c',
-        '.h': 'c',
-        '.hpp': 'cpp',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.php': 'php',
-        '.rb': 'ruby',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.scala': 'scala',
-        '.html': 'html',
-        '.htm': 'html',
-        '.css': 'css',
-        '.scss': 'scss',
-        '.sass': 'sass',
-        '.less': 'less',
-        '.sql': 'sql',
-        '.sh': 'bash',
-        '.bash': 'bash',
-        '.zsh': 'zsh',
-        '.fish': 'fish',
-        '.yml': 'yaml',
-        '.yaml': 'yaml',
-        '.json': 'json',
-        '.xml': 'xml',
-        '.md': 'markdown',
-        '.markdown': 'markdown',
-        '.txt': 'text',
-        '.toml': 'toml',
-        '.ini': 'ini',
-        '.cfg': 'ini',
-        '.conf': 'ini'
-    }
-    return language_map.get(suffix)
+    return _LANGUAGE_MAP.get(os.path.splitext(file_path)[1].lower())
 
 
 def find_files(
@@ -84,60 +142,110 @@ def find_files(
     exclude_patterns: Optional[List[str]] = None
 ) -> List[Path]:
     """Find files matching patterns, excluding specified patterns."""
-    import fnmatch
-    
-    files = []
     exclude_patterns = exclude_patterns or [
         '.git/*', '__pycache__/*', '*.pyc', 'node_modules/*',
         '.venv/*', 'venv/*', 'dist/*', 'build/*', '.DS_Store'
     ]
+    excluded = compile_glob_patterns(tuple(exclude_patterns))
+    included = compile_glob_patterns(tuple(patterns)) if patterns else None
     
-    for file_path in root_path.rglob('*'):
-        if not file_path.is_file():
-            continue
-        
-        relative_path = file_path.relative_to(root_path)
-        
-        # Check exclude patterns
-        excluded = False
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(str(relative_path), pattern):
-                excluded = True
-                break
-        
-        if excluded:
-            continue
-        
-        # Check include patterns
-        if patterns:
-            included = False
-            for pattern in patterns:
-                if fnmatch.fnmatch(str(relative_path), pattern):
-                    included = True
-                    break
-            if not included:
-                continue
-        
-        files.append(file_path)
+    # Scan the top level here, then walk each subdirectory
+    files: List[Path] = []
+    subdirs: List[Tuple[str, str]] = []
+    _scan_directory(os.fspath(root_path), '', excluded, included, files, subdirs)
+    
+    if len(subdirs) < _PARALLEL_SCAN_MIN_DIRS:
+        files.extend(_walk_tree(subdirs, excluded, included))
+        return files
+    
+    # Stat calls release the GIL, so subtrees can be scanned in parallel
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        for subtree_files in executor.map(
+            lambda subdir: _walk_tree([subdir], excluded, included), subdirs
+        ):
+            files.extend(subtree_files)
     
     return files
 
 
+def _walk_tree(
+    stack: List[Tuple[str, str]],
+    excluded: Callable[[str], Optional[re.Match]],
+    included: Optional[Callable[[str], Optional[re.Match]]]
+) -> List[Path]:
+    """Collect matching files below the given (path, relative prefix) directories."""
+    files: List[Path] = []
+    stack = list(stack)
+    while stack:
+        dir_path, prefix = stack.pop()
+        _scan_directory(dir_path, prefix, excluded, included, files, stack)
+    return files
+
+
+def _scan_directory(
+    dir_path: str,
+    prefix: str,
+    excluded: Callable[[str], Optional[re.Match]],
+    included: Optional[Callable[[str], Optional[re.Match]]],
+    files: List[Path],
+    subdirs: List[Tuple[str, str]]
+) -> None:
+    """Append matching files in one directory and queue its subdirectories.
+    
+    Paths are handled as plain strings; a Path is built only for results.
+    """
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:
+        return
+    
+    with entries:
+        for entry in entries:
+            relative_path = prefix + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip whole subtrees an exclude pattern like 'node_modules/*' covers
+                    if not excluded(relative_path + os.sep):
+                        subdirs.append((entry.path, relative_path + os.sep))
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            
+            if excluded(relative_path):
+                continue
+            if included is not None and not included(relative_path):
+                continue
+            files.append(Path(entry.path))
+
+
 def safe_read_file(file_path: Path, max_size: int = 1024 * 1024) -> str:
     """Safely read a file with size limits."""
-    if not file_path.exists():
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
         raise FileNotFoundError(f"File {file_path} not found")
     
-    if file_path.stat().st_size > max_size:
-        raise ValueError(f"File {file_path} is too large (>{max_size} bytes)")
+    with open(fd, 'rb') as f:
+        if os.fstat(fd).st_size > max_size:
+            raise ValueError(f"File {file_path} is too large (>{max_size} bytes)")
+        # st_size is only a hint: reads can come back short, and files such as
+        # those in /proc report 0, so read until EOF with the limit enforced here
+        data = f.read(max_size + 1)
+        if len(data) > max_size:
+            raise ValueError(f"File {file_path} is too large (>{max_size} bytes)")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        content = data.decode('utf-8')
     except UnicodeDecodeError:
         # Try with different encoding
-        with open(file_path, 'r', encoding='latin-1') as f:
-            return f.read()
+        content = data.decode('latin-1')
+    
+    # Match the newline translation of text-mode reads
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
 
 
 def get_file_stats(file_path: Path) -> dict:
@@ -149,7 +257,8 @@ def get_file_stats(file_path: Path) -> dict:
     content = ""
     lines = 0
     
-    if is_text_file(file_path):
+    is_text = is_text_file(file_path)
+    if is_text:
         try:
             content = safe_read_file(file_path)
             lines = len(content.splitlines())
@@ -160,6 +269,15 @@ def get_file_stats(file_path: Path) -> dict:
         'size': stat.st_size,
         'lines': lines,
         'language': get_file_language(file_path),
-        'is_text': is_text_file(file_path),
+        'is_text': is_text,
         'modified': stat.st_mtime
-    }
\ No newline at end of file
+    }
+
+
+def scratch_temp_dir() -> Optional[str]:
+    """Return a RAM-backed directory for scratch files, or None for the default.
+    
+    Uses /dev/shm where it exists and is writable (Linux); elsewhere (macOS,
+    Windows) tempfile falls back to its usual temp directory.
+    """
+    return '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
@@ -0,0 +1,85 @@
+"""Streaming utility functions."""
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+# Emit buffered text once it reaches this many characters...
+_DEFAULT_MIN_CHARS = 64
+
+# ...or once the oldest buffered chunk has waited this long, in seconds
+_DEFAULT_FLUSH_INTERVAL = 0.05
+
+# Queued by the reader task once the source stream is exhausted
+_END = object()
+
+
+async def batch_chunks(
+    stream: AsyncIterator[str],
+    min_chars: int = _DEFAULT_MIN_CHARS,
+    flush_interval: float = _DEFAULT_FLUSH_INTERVAL
+) -> AsyncIterator[str]:
+    """Merge small stream chunks into larger ones.
+    
+    Providers yield roughly a token at a time; rendering each one separately
+    costs a write and flush per token. Chunks are buffered until min_chars
+    have accumulated or flush_interval has passed since the first buffered
+    chunk, so a slow stream still shows up promptly.
+    
+    The source is consumed by a single reader task, so a provider's
+    ``async with`` block is entered and exited in the same task. Leaving
+    early cancels that task, which closes the source stream.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    reader = asyncio.ensure_future(_read_into(stream, queue))
+    buffer: List[str] = []
+    size = 0
+    deadline: Optional[float] = None
+    
+    try:
+        while True:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                chunk = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                # Flush interval passed while the next chunk is still in flight
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                deadline = None
+                continue
+            
+            if chunk is _END:
+                break
+            
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= min_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+                deadline = None
+            elif deadline is None:
+                deadline = loop.time() + flush_interval
+        
+        if buffer:
+            yield "".join(buffer)
+        
+        # Re-raise anything the source stream failed with
+        await reader
+    finally:
+        if not reader.done():
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+
+async def _read_into(stream: AsyncIterator[str], queue: asyncio.Queue) -> None:
+    """Copy chunks from stream into queue, then queue _END."""
+    try:
+        async for chunk in stream:
+            queue.put_nowait(chunk)
+    finally:
+        queue.put_nowait(_END)
+        aclose = getattr(stream, 'aclose', None)
+        if aclose is not None:
+            await aclose()
@@ -20,10 +20,18 @@ class TestChatService:
     @pytest.fixture
     def mock_dependencies(self):
         """Create mock dependencies for ChatService."""
+        repository = Mock(spec=IRepository)
+        repository.get_context.return_value = {
+            'root_path': '/test',
+            'files': [],
+            'languages': []
+        }
+        # Context reads go through the async variant; serve them from get_context
+        repository.get_context_async.side_effect = repository.get_context
         return {
             'llm_provider': Mock(spec=ILLMProvider),
             'coder': Mock(spec=ICoder),
-            'repository': Mock(spec=IRepository),
+            'repository': repository,
             'ui': Mock(spec=IUserInterface)
         }
     
@@ -72,6 +80,46 @@ class TestChatService:
         mock_dependencies['llm_provider'].generate_response.assert_called_once()
         assert len(chat_service.current_session.messages) == 3  # System + User + Assistant
     
+    def test_process_user_message_stream_records_full_response(self, chat_service, mock_dependencies):
+        """Test that streamed chunks are shown and stored as one message."""
+        # Arrange
+        mock_dependencies['repository'].get_context.return_value = {'root_path': '/test'}
+        chat_service.start_session([])
+        
+        async def fake_stream(messages, model_name, config=None):
+            for chunk in ("Hel", "lo", "!"):
+                yield chunk
+        
+        mock_dependencies['llm_provider'].generate_response_stream = fake_stream
+        
+        # Act
+        response = chat_service.process_user_message_stream("Hello", "gpt-4")
+        
+        # Assert
+        assert response == "Hello!"
+        shown = [call.args[0] for call in mock_dependencies['ui'].show_stream_chunk.call_args_list]
+        assert "".join(shown) == "Hello!"
+        mock_dependencies['ui'].end_stream.assert_called_once_with("Hello!")
+        assert len(chat_service.current_session.messages) == 3  # System + User + Assistant
+        assert chat_service.current_session.messages[-1].content == "Hello!"
+    
+    def test_capped_history_keeps_system_prompt(self, chat_service, mock_dependencies):
+        """Test that the oldest turns drop off while the system prompt stays."""
+        # Arrange
+        mock_dependencies['repository'].get_context.return_value = {'root_path': '/test'}
+        chat_service.max_history = 3
+        session = chat_service.start_session([])
+        
+        # Act
+        for text in ("one", "two", "three"):
+            session.add_message(ChatMessage(role=MessageRole.USER, content=text))
+        
+        # Assert
+        assert [message.role for message in session.messages] == [
+            MessageRole.SYSTEM, MessageRole.USER, MessageRole.USER
+        ]
+        assert [message.content for message in session.messages][1:] == ["two", "three"]
+    
     def test_process_user_message_handles_code_changes(self, chat_service, mock_dependencies):
         """Test that code changes in LLM response are handled."""
         # Arrange
@@ -109,7 +157,7 @@ class TestChatService:
         mock_dependencies['coder'].validate_changes.return_value = ValidationResult(
             is_valid=True, errors=[], warnings=[]
         )
-        mock_dependencies['coder'].apply_changes.return_value = True
+        mock_dependencies['coder'].apply_changes_async.return_value = True
         mock_dependencies['ui'].confirm_changes.return_value = True
         mock_dependencies['repository'].commit_changes.return_value = "abc123"
         
@@ -120,7 +168,7 @@ class TestChatService:
         mock_dependencies['coder'].parse_response.assert_called_once()
         mock_dependencies['coder'].validate_changes.assert_called_once()
         mock_dependencies['ui'].confirm_changes.assert_called_once()
-        mock_dependencies['coder'].apply_changes.assert_called_once()
+        mock_dependencies['coder'].apply_changes_async.assert_called_once()
         mock_dependencies['repository'].commit_changes.assert_called_once()
     
     def test_add_files_to_context(self, chat_service, mock_dependencies):
@@ -140,6 +188,48 @@ class TestChatService:
         assert 'new_file.py' in session.active_files
         assert 'file_contents' in session.context
     
+    def test_context_size_tracks_updates(self, chat_service, mock_dependencies):
+        """Test that the session context size follows context changes."""
+        # Arrange
+        mock_dependencies['repository'].get_context.return_value = {
+            'root_path': '/test',
+            'files': [],
+            'languages': []
+        }
+        session = chat_service.start_session([])
+        initial_size = session.get_context_size()
+        mock_dependencies['repository'].get_context.return_value = {
+            'file_contents': {'new_file.py': 'print("hello")'}
+        }
+        
+        # Act
+        chat_service.add_files_to_context(['new_file.py'])
+        
+        # Assert
+        assert session.get_context_size() == initial_size + len(str({'new_file.py': 'print("hello")'}))
+        session.clear_context()
+        assert session.get_context_size() == 0
+    
+    def test_add_files_keeps_earlier_files_in_prompt(self, chat_service, mock_dependencies):
+        """Test that adding files extends the system prompt instead of replacing it."""
+        # Arrange
+        mock_dependencies['coder'].generate_prompt.return_value = ""
+        mock_dependencies['repository'].get_context.return_value = {
+            'file_contents': {'a.py': 'x = 1'}
+        }
+        session = chat_service.start_session(['a.py'])
+        mock_dependencies['repository'].get_context.return_value = {
+            'file_contents': {'b.py': 'y = 2'}
+        }
+        
+        # Act
+        chat_service.add_files_to_context(['b.py'])
+        
+        # Assert
+        prompt = session.messages[0].content
+        assert "--- a.py ---\nx = 1" in prompt
+        assert "--- b.py ---\ny = 2" in prompt
+    
     def test_get_session_summary(self, chat_service, mock_dependencies):
         """Test getting session summary."""
         # Arrange
@@ -1,11 +1,38 @@
 """Unit tests for EditBlockCoder."""
 
+import asyncio
+import os
 import pytest
 import tempfile
 from pathlib import Path
 
 from aidant.infrastructure.coders.editblock.editblock_coder import EditBlockCoder
 from aidant.core.interfaces.coder import ChangeType, ParseError
+from aidant.utils.file_utils import scratch_temp_dir
+
+
+# Contents of test.py in every workspace
+_TEST_FILE_CONTENT = """def hello():
+    print("Hello, World!")
+
+def goodbye():
+    print("Goodbye!")
+"""
+
+
+@pytest.fixture(scope="module")
+def readonly_workspace():
+    """Create a workspace shared by tests that never write to it."""
+    with tempfile.TemporaryDirectory(dir=scratch_temp_dir()) as temp_dir:
+        workspace = Path(temp_dir)
+        (workspace / "test.py").write_text(_TEST_FILE_CONTENT)
+        yield workspace
+
+
+@pytest.fixture(scope="module")
+def readonly_coder(readonly_workspace):
+    """Create an EditBlockCoder over the shared read-only workspace."""
+    return EditBlockCoder(str(readonly_workspace))
 
 
 class TestEditBlockCoder:
@@ -14,17 +41,12 @@ class TestEditBlockCoder:
     @pytest.fixture
     def temp_workspace(self):
         """Create a temporary workspace for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=scratch_temp_dir()) as temp_dir:
             workspace = Path(temp_dir)
             
             # Create a test file
             test_file = workspace / "test.py"
-            test_file.write_text("""def hello():
-    print("Hello, World!")
-
-def goodbye():
-    print("Goodbye!")
-""")
+            test_file.write_text(_TEST_FILE_CONTENT)
             yield workspace
     
     @pytest.fixture
@@ -32,7 +54,7 @@ def goodbye():
         """Create EditBlockCoder instance."""
         return EditBlockCoder(str(temp_workspace))
     
-    def test_parse_search_replace_block(self, coder):
+    def test_parse_search_replace_block(self, readonly_coder):
         """Test parsing SEARCH/REPLACE blocks."""
         response = """Here's the fix:
 
@@ -46,7 +68,7 @@ def hello(name="World"):
 >>>>>>> REPLACE
 """
         
-        changes = coder.parse_response(response)
+        changes = readonly_coder.parse_response(response)
         
         assert len(changes) == 1
         change = changes[0]
@@ -55,7 +77,7 @@ def hello(name="World"):
         assert 'def hello():' in change.old_content
         assert 'def hello(name="World"):' in change.content
     
-    def test_parse_fenced_code_block(self, coder):
+    def test_parse_fenced_code_block(self, readonly_coder):
         """Test parsing fenced code blocks with SEARCH/REPLACE."""
         response = """```python
 test.py
@@ -68,14 +90,14 @@ def goodbye(name="World"):
 >>>>>>> REPLACE
 ```"""
         
-        changes = coder.parse_response(response)
+        changes = readonly_coder.parse_response(response)
         
         assert len(changes) == 1
         change = changes[0]
         assert change.file_path == "test.py"
         assert change.change_type == ChangeType.MODIFY
     
-    def test_parse_file_creation(self, coder):
+    def test_parse_file_creation(self, readonly_coder):
         """Test parsing file creation blocks."""
         response = """```python
 new_file.py
@@ -83,7 +105,7 @@ def new_function():
     return "Hello from new file"
 ```"""
         
-        changes = coder.parse_response(response)
+        changes = readonly_coder.parse_response(response)
         
         assert len(changes) == 1
         change = changes[0]
@@ -91,7 +113,7 @@ def new_function():
         assert change.change_type == ChangeType.CREATE
         assert "def new_function():" in change.content
     
-    def test_parse_multiple_blocks(self, coder):
+    def test_parse_multiple_blocks(self, readonly_coder):
         """Test parsing multiple SEARCH/REPLACE blocks."""
         response = """Here are the changes:
 
@@ -114,20 +136,20 @@ def goodbye(name="World"):
 >>>>>>> REPLACE
 """
         
-        changes = coder.parse_response(response)
+        changes = readonly_coder.parse_response(response)
         
         assert len(changes) == 2
         assert all(change.file_path == "test.py" for change in changes)
         assert all(change.change_type == ChangeType.MODIFY for change in changes)
     
-    def test_parse_no_blocks_raises_error(self, coder):
+    def test_parse_no_blocks_raises_error(self, readonly_coder):
         """Test that responses without valid blocks raise ParseError."""
         response = "Just a regular response without any code blocks."
         
         with pytest.raises(ParseError):
-            coder.parse_response(response)
+            readonly_coder.parse_response(response)
     
-    def test_validate_changes_existing_file(self, coder, temp_workspace):
+    def test_validate_changes_existing_file(self, readonly_coder):
         """Test validation of changes to existing files."""
         # Create change for existing file
         from aidant.core.interfaces.coder import CodeChange
@@ -139,12 +161,12 @@ def goodbye(name="World"):
             old_content='def hello():\n    print("Hello, World!")'
         )
         
-        result = coder.validate_changes([change])
+        result = readonly_coder.validate_changes([change])
         
         assert result.is_valid
         assert len(result.errors) == 0
     
-    def test_validate_changes_missing_file(self, coder):
+    def test_validate_changes_missing_file(self, readonly_coder):
         """Test validation fails for missing files."""
         from aidant.core.interfaces.coder import CodeChange
         
@@ -155,13 +177,13 @@ def goodbye(name="World"):
             old_content="old content"
         )
         
-        result = coder.validate_changes([change])
+        result = readonly_coder.validate_changes([change])
         
         assert not result.is_valid
         assert len(result.errors) > 0
         assert "does not exist" in result.errors[0]
     
-    def test_validate_changes_search_not_found(self, coder, temp_workspace):
+    def test_validate_changes_search_not_found(self, readonly_coder):
         """Test validation fails when search content not found."""
         from aidant.core.interfaces.coder import CodeChange
         
@@ -172,7 +194,7 @@ def goodbye(name="World"):
             old_content="this content does not exist in the file"
         )
         
-        result = coder.validate_changes([change])
+        result = readonly_coder.validate_changes([change])
         
         assert not result.is_valid
         assert len(result.errors) > 0
@@ -199,6 +221,80 @@ def goodbye(name="World"):
         assert 'def hello(name="World"):' in content
         assert 'print(f"Hello, {name}!")' in content
     
+    def test_apply_failure_keeps_earlier_changes(self, coder, temp_workspace):
+        """Test that changes before a failing one are still written, in order."""
+        from aidant.core.interfaces.coder import CodeChange, ApplyError
+        
+        changes = [
+            CodeChange(
+                file_path="test.py",
+                change_type=ChangeType.MODIFY,
+                content='def hello(name="World"):\n    print(f"Hello, {name}!")',
+                old_content='def hello():\n    print("Hello, World!")'
+            ),
+            CodeChange(
+                file_path="created.py",
+                change_type=ChangeType.CREATE,
+                content="VALUE = 1"
+            ),
+            CodeChange(
+                file_path="./test.py",
+                change_type=ChangeType.MODIFY,
+                content="new content",
+                old_content="this content does not exist in the file"
+            )
+        ]
+        
+        with pytest.raises(ApplyError):
+            coder.apply_changes(changes)
+        
+        assert 'def hello(name="World"):' in (temp_workspace / "test.py").read_text()
+        assert (temp_workspace / "created.py").read_text() == "VALUE = 1"
+    
+    def test_apply_modify_through_symlink(self, coder, temp_workspace):
+        """Test that editing a symlinked file changes its target and keeps the link."""
+        from aidant.core.interfaces.coder import CodeChange
+        
+        link = temp_workspace / "link.py"
+        try:
+            link.symlink_to(temp_workspace / "test.py")
+        except OSError:
+            pytest.skip("symlinks are not supported here")
+        
+        change = CodeChange(
+            file_path="link.py",
+            change_type=ChangeType.MODIFY,
+            content='def hello(name="World"):\n    print(f"Hello, {name}!")',
+            old_content='def hello():\n    print("Hello, World!")'
+        )
+        
+        assert coder.apply_changes([change])
+        
+        assert link.is_symlink()
+        assert 'def hello(name="World"):' in (temp_workspace / "test.py").read_text()
+    
+    def test_apply_modify_keeps_hard_links(self, coder, temp_workspace):
+        """Test that editing a hard-linked file changes every link."""
+        from aidant.core.interfaces.coder import CodeChange
+        
+        link = temp_workspace / "hardlink.py"
+        try:
+            os.link(temp_workspace / "test.py", link)
+        except OSError:
+            pytest.skip("hard links are not supported here")
+        
+        change = CodeChange(
+            file_path="test.py",
+            change_type=ChangeType.MODIFY,
+            content='def hello(name="World"):\n    print(f"Hello, {name}!")',
+            old_content='def hello():\n    print("Hello, World!")'
+        )
+        
+        assert coder.apply_changes([change])
+        
+        assert os.path.samefile(link, temp_workspace / "test.py")
+        assert 'def hello(name="World"):' in link.read_text()
+    
     def test_apply_create_change(self, coder, temp_workspace):
         """Test applying file creation changes."""
         from aidant.core.interfaces.coder import CodeChange
@@ -219,24 +315,56 @@ def goodbye(name="World"):
         content = new_file.read_text()
         assert "def new_function():" in content
     
-    def test_can_handle_file_types(self, coder):
+    def test_apply_changes_async(self, coder, temp_workspace):
+        """Test applying changes to several files concurrently."""
+        from aidant.core.interfaces.coder import CodeChange
+        
+        changes = [
+            CodeChange(
+                file_path="test.py",
+                change_type=ChangeType.MODIFY,
+                content='def hello(name="World"):\n    print(f"Hello, {name}!")',
+                old_content='def hello():\n    print("Hello, World!")'
+            ),
+            CodeChange(
+                file_path="test.py",
+                change_type=ChangeType.MODIFY,
+                content='def goodbye(name="World"):\n    print(f"Goodbye, {name}!")',
+                old_content='def goodbye():\n    print("Goodbye!")'
+            ),
+            CodeChange(
+                file_path="other.py",
+                change_type=ChangeType.CREATE,
+                content="VALUE = 1"
+            )
+        ]
+        
+        success = asyncio.run(coder.apply_changes_async(changes))
+        
+        assert success
+        content = (temp_workspace / "test.py").read_text()
+        assert 'def hello(name="World"):' in content
+        assert 'def goodbye(name="World"):' in content
+        assert (temp_workspace / "other.py").read_text() == "VALUE = 1"
+    
+    def test_can_handle_file_types(self, readonly_coder):
         """Test file type handling."""
         # Text files should be handled
-        assert coder.can_handle_file("test.py")
-        assert coder.can_handle_file("script.js")
-        assert coder.can_handle_file("style.css")
-        assert coder.can_handle_file("README.md")
+        assert readonly_coder.can_handle_file("test.py")
+        assert readonly_coder.can_handle_file("script.js")
+        assert readonly_coder.can_handle_file("style.css")
+        assert readonly_coder.can_handle_file("README.md")
         
         # Binary files should not be handled
-        assert not coder.can_handle_file("image.jpg")
-        assert not coder.can_handle_file("binary.exe")
-        assert not coder.can_handle_file("archive.zip")
+        assert not readonly_coder.can_handle_file("image.jpg")
+        assert not readonly_coder.can_handle_file("binary.exe")
+        assert not readonly_coder.can_handle_file("archive.zip")
     
-    def test_generate_prompt(self, coder):
+    def test_generate_prompt(self, readonly_coder):
         """Test prompt generation."""
         context = {"files": ["test.py"], "languages": ["python"]}
         
-        prompt = coder.generate_prompt(context)
+        prompt = readonly_coder.generate_prompt(context)
         
         assert "SEARCH" in prompt
         assert "REPLACE" in prompt
@@ -0,0 +1,40 @@
+"""Unit tests for stream batching."""
+
+import asyncio
+
+from aidant.utils.streaming import batch_chunks
+
+
+class TestBatchChunks:
+    """Test cases for batch_chunks."""
+    
+    def test_merges_small_chunks(self):
+        """Test that chunks are merged up to the size threshold."""
+        async def source():
+            for chunk in ("ab", "cd", "ef", "g"):
+                yield chunk
+        
+        async def collect():
+            return [batch async for batch in batch_chunks(source(), min_chars=4)]
+        
+        assert asyncio.run(collect()) == ["abcd", "efg"]
+    
+    def test_early_exit_closes_source(self):
+        """Test that leaving the batched stream early closes the source stream."""
+        closed = asyncio.Event()
+        
+        async def source():
+            try:
+                yield "first"
+                await asyncio.sleep(10)
+                yield "never"
+            finally:
+                closed.set()
+        
+        async def consume_one():
+            batches = batch_chunks(source(), min_chars=1)
+            assert await batches.__anext__() == "first"
+            await batches.aclose()
+            return closed.is_set()
+        
+        assert asyncio.run(consume_one())